@@ -1,15 +1,36 @@
+import asyncio
 import logging
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers import config_validation as cv
+from homeassistant.const import Platform
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.components import websocket_api
-from homeassistant.helpers.event import async_call_later  # Import async_call_later directly
-
-from .const import DOMAIN, CONF_API_KEY, CONF_API_URL, CONF_NAME
+# Imported by name: the package's own ``webhook`` submodule shadows the component module
+from homeassistant.components.webhook import async_generate_id, async_generate_path, async_unregister
+from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_API_KEY,
+    CONF_API_URL,
+    CONF_NAME,
+    CONF_WEBHOOK_ID,
+    CONF_EVENT_DEDUP_WINDOW,
+    DEFAULT_EVENT_DEDUP_WINDOW,
+    SETUP_VALIDATE_TIMEOUT,
+)
 from .api import CampingCareAPI
+from .coordinator import CampingCareCoordinator
+from .index import ReservationIndex
+from .events import EventThrottle
+from .prefetch import ArrivalPrefetcher, prefetch_time
+from .services import async_setup_services
+from .store import ReservationStore, async_remove_store
+from .sync import ReservationSync
+from .webhook import async_register_webhook
 
 
 from aiohttp import ClientError, ClientConnectionError, ClientSession, InvalidURL, web, web_response
@@ -17,9 +38,14 @@ from aiohttp.web_exceptions import HTTPBadRequest
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the CampingCare integration."""
     _LOGGER.info("CampingCareHA: async_setup called — skipping YAML config.")
+    hass.data.setdefault(DOMAIN, {})
+    # Services serve every entry, so they are registered once, not per entry
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -37,160 +63,128 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Initialize the API client
     api_client = CampingCareAPI(api_url, api_key)
 
+    # Local plate index, kept in sync in the background and persisted on disk
+    index = ReservationIndex()
+    reservation_sync = ReservationSync(api_client, index)
+    store = ReservationStore(hass, entry.entry_id, reservation_sync)
+
+    # With a snapshot, lookups can be served before the API answers, so the
+    # API is only checked in the background. Without one the entry has nothing
+    # to serve yet: wait briefly for the API and let HA retry (with backoff)
+    # when it is not reachable
+    snapshot = await store.async_load()
+    if snapshot is None:
+        await _async_validate_api(api_client, name)
+
+    prefetcher = ArrivalPrefetcher(reservation_sync)
+    events = EventThrottle(entry.options.get(CONF_EVENT_DEDUP_WINDOW, DEFAULT_EVENT_DEDUP_WINDOW))
+    coordinator = CampingCareCoordinator(hass, entry, reservation_sync, store, prefetcher, events)
+
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_NAME: name,
         "api_client": api_client,
+        "index": index,
+        "sync": reservation_sync,
+        "store": store,
+        "prefetch": prefetcher,
+        "events": events,
+        "coordinator": coordinator,
     }
 
-    # Test the API connection
-    if not await api_client.test_connection():
-        _LOGGER.error("CampingCareHA: Failed to connect to the CampingCare API.")
-        return False
+    async def _async_test_connection():
+        """Check the API connection without holding up setup."""
+        if not await api_client.test_connection():
+            _LOGGER.error("CampingCareHA: Failed to connect to the CampingCare API.")
+
+    if snapshot is not None:
+        entry.async_create_background_task(hass, _async_test_connection(), f"{DOMAIN}_test_connection")
+
+    # The coordinator drives the index sync; keep it polling even when every
+    # entity is disabled, since plate lookups depend on the index too
+    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+
+    async def _async_prefetch():
+        """Refresh today's arrivals ahead of the arrival window."""
+        await prefetcher.async_prefetch(dt_util.now())
+        coordinator.async_index_changed()
+
+    @callback
+    def _schedule_prefetch(now):
+        """Start the daily prefetch as a task that is cancelled on unload."""
+        entry.async_create_background_task(hass, _async_prefetch(), f"{DOMAIN}_prefetch")
+
+    async def _async_initial_sync():
+        """Restore the snapshot and sync the index, then catch up on a missed prefetch."""
+        if snapshot is not None:
+            restored = await store.async_restore(snapshot)
+            _LOGGER.info("CampingCareHA: Serving %s known plates from the local snapshot.", restored)
+        await coordinator.async_refresh()
+        if prefetcher.is_due(dt_util.now()):
+            await _async_prefetch()
+
+    entry.async_create_background_task(hass, _async_initial_sync(), f"{DOMAIN}_initial_sync")
+
+    # Warm the index for the day's arrivals before the gate gets busy
+    at = prefetch_time()
+    entry.async_on_unload(
+        async_track_time_change(hass, _schedule_prefetch, hour=at.hour, minute=at.minute, second=0)
+    )
 
-    websocket_api.async_register_command(
-        hass,
-        websocket_query_license_plate,
-        f"{DOMAIN}/query_license_plate"
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Accept pushed reservation/plate changes so the index stays current
+    # between syncs without outbound calls
+    if CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: async_generate_id()}
+        )
+    async_register_webhook(hass, entry, name, entry.data[CONF_WEBHOOK_ID])
+    entry.async_on_unload(lambda: async_unregister(hass, entry.data[CONF_WEBHOOK_ID]))
+    # The webhook id is the endpoint's only credential; keep it out of INFO logs
+    _LOGGER.debug(
+        "CampingCareHA: Reservation changes for '%s' can be pushed to %s",
+        name, async_generate_path(entry.data[CONF_WEBHOOK_ID]),
     )
 
-    async def handle_check_plate(call: ServiceCall):
-        """Handle the check_plate service."""
-        plate = call.data.get("plate")
-        entry_id = list(hass.data[DOMAIN].keys())[0] if hass.data[DOMAIN] else None
+    return True
 
-        if not entry_id:
-            _LOGGER.error("No valid CampingCareHA entry found.")
-            return
+async def _async_validate_api(api_client: CampingCareAPI, name: str) -> None:
+    """Check the API during setup; raise when the entry cannot be set up yet.
 
-        api_client = hass.data[DOMAIN][entry_id]["api_client"]
-        result = await api_client.check_license_plate(plate)
+    Raises ConfigEntryError when the API key is rejected and ConfigEntryNotReady
+    for anything that may pass on a later attempt (timeouts, connection errors,
+    rate limiting, server errors).
+    """
+    try:
+        async with asyncio.timeout(SETUP_VALIDATE_TIMEOUT):
+            status = await api_client.connection_status()
+    except TimeoutError:
+        status = None
 
-        if result["success"]:
-            _LOGGER.info("CampingCareHA: Plate %s is valid: %s", plate, result["data"])
-        else:
-            _LOGGER.warning("CampingCareHA: Plate %s check failed: %s", plate, result["error"])
-    
-    async def handle_query_plate(call: ServiceCall):
-        """Handle the query_plate service."""
-        plate = call.data.get("plate")
-        entry_id = list(hass.data[DOMAIN].keys())[0] if hass.data[DOMAIN] else None
-
-        if not entry_id:
-            _LOGGER.error("No valid CampingCareHA entry found.")
-            return
-
-        api_client = hass.data[DOMAIN][entry_id]["api_client"]
-        result = await api_client.query_license_plate(plate)
-
-        if result["success"]:
-            hass.bus.async_fire(
-                f"{DOMAIN}_query_license_plate",
-                {
-                    "entry_id": entry_id,
-                    "plate": plate,
-                    "result": result["data"],
-                }
-            )
-            _LOGGER.info("CampingCareHA: Plate %s is known.", plate)
-            # _LOGGER.info("CampingCareHA: Plate %s is valid: %s", plate, result["data"])
-        else:
-            _LOGGER.warning("CampingCareHA: Plate %s check failed: %s", plate, result["error"])
-    
-    async def handle_get_reservation(call: ServiceCall):
-        """Handle the get_reservation service."""
-        reservation_id = call.data.get("reservation_id")
-        entry_id = list(hass.data[DOMAIN].keys())[0] if hass.data[DOMAIN] else None
-    
-        if not entry_id:
-            _LOGGER.error("No valid CampingCareHA entry found.")
-            return
-    
-        api_client = hass.data[DOMAIN][entry_id]["api_client"]
-        result = await api_client.get_reservation(reservation_id)
-    
-        if result["success"]:
-            hass.bus.async_fire(
-                f"{DOMAIN}_get_reservation",
-                {
-                    "entry_id": entry_id,
-                    "reservation_id": reservation_id,
-                    "result": result["data"],
-                }
-            )
-            _LOGGER.info("CampingCareHA: Reservation %s retrieved successfully: %s", reservation_id, result["data"])
-        else:
-            _LOGGER.warning("CampingCareHA: Failed to retrieve reservation %s: %s", reservation_id, result["error"])
-
-    # Register the services
-    hass.services.async_register(
-        domain="campingcareha",
-        service="get_reservation",
-        service_func=handle_get_reservation,
-        schema=vol.Schema({
-            vol.Required("reservation_id"): str,
-        }),
-    )
-
-    hass.services.async_register(
-        domain="campingcareha",
-        service="check_plate",
-        service_func=handle_check_plate,
-        schema=vol.Schema({
-            vol.Required("plate"): str,
-        }),
-    )
-
-    hass.services.async_register(
-        domain="campingcareha",
-        service="query_plate",
-        service_func=handle_query_plate,
-        schema=vol.Schema({
-            vol.Required("plate"): str,
-        }),
+    if status == 200:
+        return
+    await api_client.close()
+    if status in (401, 403):
+        raise ConfigEntryError(f"CampingCare rejected the API key for '{name}' (HTTP {status})")
+    raise ConfigEntryNotReady(
+        f"CampingCare API not reachable for '{name}' ({f'HTTP {status}' if status else 'no answer'})"
     )
 
-    return True
-
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    hass.data[DOMAIN].pop(entry.entry_id, None)
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+    if entry_data:
+        await entry_data["store"].async_save()
+        await entry_data["api_client"].close()
     _LOGGER.info("Unloaded CampingCareHA entry '%s'", entry.entry_id)
     return True
 
-async def websocket_query_license_plate(hass: HomeAssistant, connection, msg):
-    """Handle WebSocket license plate lookup."""
-    plate = msg.get("plate")
-    entry_id = msg.get("entry_id")
-
-    # Log the entry_id for debugging
-    _LOGGER.debug("CampingCareHA: config entry id: %s", entry_id)
-    _LOGGER.debug("CampingCareHA: WebSocket query_license_plate called with plate: %s", plate)
-
-    if not plate or not entry_id or entry_id not in hass.data[DOMAIN]:
-        if connection:
-            connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Missing or invalid plate/entry_id")
-        return
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the local snapshot when a config entry is deleted."""
+    await async_remove_store(hass, entry.entry_id)
 
-    # Retrieve the API client
-    api_client = hass.data[DOMAIN][entry_id]["api_client"]
-
-    # Use the API client to check the license plate
-    result = await api_client.check_license_plate(plate)
-
-    if result["success"]:
-        _LOGGER.debug("CampingCareHA: License plate %s is valid: %s", plate, result["data"])
-        if connection:
-            connection.send_message({
-                "id": msg["id"],
-                "type": "result",
-                "success": True,
-                "result": result["data"]
-            })
-    else:
-        _LOGGER.error("CampingCareHA: License plate %s check failed: %s", plate, result["error"])
-        if connection:
-            connection.send_error(msg["id"], "api_error", result["error"])
-            
 # async def test_api_connection(url: str, api_key: str):
 #     """Test the API connection."""
 #     try:
@@ -1,16 +1,248 @@
+import asyncio
 import logging
-from aiohttp import ClientSession, ClientError
-from .const import ApiEndpoints, ApiQuery
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
+from aiohttp import ClientResponse, ClientSession, ClientError, ClientTimeout, ServerTimeoutError, TCPConnector
+from .cache import LookupCache
+from .coalesce import RequestCoalescer
+from .const import (
+    ApiEndpoints,
+    ApiParams,
+    ApiQuery,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    CACHE_MAX_SIZE,
+    CACHE_TTL_CHECK_PLATE,
+    CACHE_TTL_NOT_FOUND,
+    CACHE_TTL_QUERY_PLATE,
+    ERROR_NO_RESERVATION,
+    ERROR_RESERVATION_NOT_FOUND,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_PAUSE,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_PER_SECOND,
+    REQUEST_BACKOFF_BASE,
+    REQUEST_BACKOFF_MAX,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_READ_TIMEOUT,
+    REQUEST_RETRIES,
+    REQUEST_TIMEOUTS,
+    RESERVATION_BATCH_CONCURRENCY,
+    RESERVATION_BATCH_MAX,
+    RESERVATION_BATCH_WINDOW,
+    STREAM_CHUNK_SIZE,
+    SYNC_PAGE_SIZE,
+)
+from .matching import normalize_plate
+from .metrics import OUTCOME_ERROR, OUTCOME_OK, OUTCOME_TIMEOUT, ApiMetrics
+from .models import ReservationSummary, async_parse_array
+from .resilience import CircuitBreaker, TokenBucket, backoff_delay, retry_after
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class PageError(ClientError):
+    """Raised by the page iterators when a page could not be retrieved."""
+
+
 class CampingCareAPI:
-    """Class to handle API communication with CampingCare."""
+    """Class to handle API communication with CampingCare.
+
+    The client has no Home Assistant dependency. Pass ``session`` to run it on
+    a session the caller manages (e.g. Home Assistant's shared session or an
+    ETL job's own); otherwise it creates and owns a pooled session. An
+    injected session is never closed by :meth:`close`. Standalone use:
+
+        async with CampingCareAPI(url, key) as api:
+            async for page in api.iter_reservations():
+                ...
+    """
 
-    def __init__(self, api_url: str, api_key: str):
+    def __init__(self, api_url: str, api_key: str, session: ClientSession | None = None):
         """Initialize the API client."""
         self.api_url = api_url
         self.api_key = api_key
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._session: ClientSession | None = session
+        self._owns_session = session is None
+        self._cache = LookupCache(CACHE_MAX_SIZE)
+        self._breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT)
+        self._rate_limiter = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        self._reservations = RequestCoalescer(
+            self._fetch_reservation,
+            RESERVATION_BATCH_WINDOW,
+            RESERVATION_BATCH_MAX,
+            RESERVATION_BATCH_CONCURRENCY,
+        )
+        self.metrics = ApiMetrics()
+
+    def _get_session(self) -> ClientSession:
+        """Return the pooled session, creating it on first use.
+
+        The session is created lazily so it binds to the running event loop, and
+        it is reused for every request so connections stay alive between lookups.
+        """
+        if not self._owns_session:
+            return self._session
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=POOL_DNS_CACHE_TTL,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+            )
+            self._session = ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session and release its connections (an injected session is left open)."""
+        self._reservations.cancel()
+        if not self._owns_session:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "CampingCareAPI":
+        """Use the client as an async context manager that closes it on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client."""
+        await self.close()
+
+    @property
+    def cache_stats(self) -> dict:
+        """Return hit/miss/eviction counters of the plate lookup cache."""
+        return self._cache.stats
+
+    @property
+    def reservation_stats(self) -> dict:
+        """Return the coalescing counters of get_reservation."""
+        return self._reservations.stats
+
+    @property
+    def circuit_state(self) -> str:
+        """Return the circuit breaker state (closed, open or half_open)."""
+        return self._breaker.state
+
+    def invalidate_cache(self, plate: str | None = None) -> None:
+        """Drop cached lookups for one plate, or all of them."""
+        if plate is None:
+            self._cache.invalidate()
+            return
+        key = normalize_plate(plate)
+        self._cache.invalidate(("check", key))
+        self._cache.invalidate(("query", key))
+        self._cache.invalidate(("query_full", key))
+
+    async def _request(
+        self,
+        endpoint: ApiEndpoints,
+        path: str,
+        params: dict | None = None,
+        text: bool = False,
+        parse: Callable[[ClientResponse], Awaitable[Any]] | None = None,
+    ) -> tuple[int, Any]:
+        """GET ``path`` through the request pipeline and record its metrics.
+
+        ``parse`` reads the body of a 200 answer instead of ``response.json()``.
+        """
+        name = endpoint.name.lower()
+        started = self.metrics.start(name)
+        outcome = OUTCOME_ERROR
+        try:
+            status, body = await self._send(endpoint, path, params, text, parse)
+            if status < 500 and status != 429:
+                outcome = OUTCOME_OK
+            return status, body
+        except ServerTimeoutError:
+            outcome = OUTCOME_TIMEOUT
+            raise
+        finally:
+            self.metrics.finish(name, started, outcome)
+
+    async def _send(
+        self,
+        endpoint: ApiEndpoints,
+        path: str,
+        params: dict | None,
+        text: bool,
+        parse: Callable[[ClientResponse], Awaitable[Any]] | None,
+    ) -> tuple[int, Any]:
+        """GET ``path`` with timeouts, retries, rate limiting and the circuit breaker.
+
+        Every request waits for the rate limiter and is rejected outright while
+        the circuit breaker is open. Connection errors, timeouts, 429 and 5xx
+        answers are retried with jittered exponential backoff (all endpoints are
+        idempotent GETs); a 429 Retry-After (capped at RATE_LIMIT_MAX_PAUSE)
+        pauses every request of this client, and a request that would wait out
+        more than RATE_LIMIT_MAX_WAIT of it fails fast with RateLimitedError so
+        lookups fall back to stale answers instead of queueing. The body is
+        only read for 200 answers. Raises ClientError once retries are
+        exhausted (timeouts are raised as ServerTimeoutError).
+        """
+        connect, read = REQUEST_TIMEOUTS.get(endpoint, (REQUEST_CONNECT_TIMEOUT, REQUEST_READ_TIMEOUT))
+        timeout = ClientTimeout(sock_connect=connect, sock_read=read)
+
+        for attempt in range(REQUEST_RETRIES + 1):
+            if attempt:
+                self.metrics.retry(endpoint.name.lower())
+            probe = self._breaker.check()
+            try:
+                await self._rate_limiter.acquire(RATE_LIMIT_MAX_WAIT)
+                last_attempt = attempt == REQUEST_RETRIES
+                try:
+                    session = self._get_session()
+                    async with session.get(
+                        f"{self.api_url}{path}",
+                        params=params,
+                        headers=self._headers,
+                        timeout=timeout,
+                    ) as response:
+                        if response.status == 429:
+                            delay = retry_after(response.headers.get("Retry-After"), RATE_LIMIT_MAX_PAUSE)
+                            if delay is None:
+                                delay = backoff_delay(attempt, REQUEST_BACKOFF_BASE, REQUEST_BACKOFF_MAX)
+                            _LOGGER.warning("CampingCareAPI: Rate limited by the API, pausing requests for %.1fs", delay)
+                            self._rate_limiter.pause(delay)
+                            if not last_attempt:
+                                continue
+                            return response.status, None
+                        if response.status >= 500:
+                            self._breaker.record_failure()
+                            if not last_attempt:
+                                _LOGGER.debug("CampingCareAPI: API error %s on %s, retrying", response.status, endpoint.name)
+                                await asyncio.sleep(backoff_delay(attempt, REQUEST_BACKOFF_BASE, REQUEST_BACKOFF_MAX))
+                                continue
+                            return response.status, None
+                        body = None
+                        if response.status == 200:
+                            if parse is not None:
+                                body = await parse(response)
+                            else:
+                                body = await (response.text() if text else response.json())
+                        self._breaker.record_success()
+                        return response.status, body
+                except (ClientError, asyncio.TimeoutError) as e:
+                    self._breaker.record_failure()
+                    if last_attempt:
+                        if isinstance(e, ClientError):
+                            raise
+                        raise ServerTimeoutError(f"Timeout on {endpoint.name}") from e
+                    _LOGGER.debug("CampingCareAPI: Request to %s failed (%r), retrying", endpoint.name, e)
+                    await asyncio.sleep(backoff_delay(attempt, REQUEST_BACKOFF_BASE, REQUEST_BACKOFF_MAX))
+            finally:
+                # A probe that ended without an outcome (429, cancellation,
+                # a parse error) must not keep the breaker half-open for good
+                if probe:
+                    self._breaker.release_probe()
+
+        raise AssertionError("unreachable")
 
     async def test_connection(self) -> bool:
         """Test the API connection."""
@@ -21,105 +253,285 @@ class CampingCareAPI:
         _LOGGER.warning("CampingCareAPI: API test failed. (Unable to get positive answer on version request)")
         return False
 
+    async def connection_status(self) -> int | None:
+        """Return the HTTP status of a version request, or None if the API could not be reached."""
+        try:
+            status, _ = await self._request(ApiEndpoints.GET_API_VERSION, ApiEndpoints.GET_API_VERSION, text=True)
+            return status
+        except ClientError as e:
+            _LOGGER.debug("CampingCareAPI: API not reachable: %s", e)
+            return None
+
     async def version(self) -> str:
         """Get the API version."""
         try:
-            async with ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}{ApiEndpoints.GET_API_VERSION}",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                ) as response:
-                    if response.status == 200:
-                        _version = await response.text()
-                        _LOGGER.debug("CampingCareAPI: Version request successful: %s", _version)
-                        return str(_version)
-                    else:
-                        _LOGGER.error("CampingCareAPI: API error: %s", response.status)
-                        return None
+            status, _version = await self._request(ApiEndpoints.GET_API_VERSION, ApiEndpoints.GET_API_VERSION, text=True)
+            if status == 200:
+                _LOGGER.debug("CampingCareAPI: Version request successful: %s", _version)
+                return str(_version)
+            else:
+                _LOGGER.error("CampingCareAPI: API error: %s", status)
+                return None
         except ClientError as e:
             _LOGGER.error("CampingCareAPI: API request failed: %s", e)
             return None
-        
+
 
     async def check_license_plate(self, plate: str) -> dict:
-        """Check if a license plate is valid."""
+        """Check if a license plate is valid (cached).
+
+        The plate is sent normalized, so the cache key is exactly what was asked.
+        """
+        plate = normalize_plate(plate)
+        key = ("check", plate)
+        result = await self._cache.get_or_fetch(
+            key,
+            lambda: self._fetch_check_license_plate(plate),
+            lambda result: CACHE_TTL_CHECK_PLATE if result["success"] else 0,
+        )
+        return self._stale_on_failure(key, result)
+
+    async def _fetch_check_license_plate(self, plate: str) -> dict:
+        """Check a license plate against the API."""
         try:
-            async with ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}{ApiEndpoints.CHECK_LICENSE_PLATE.format(plate=plate)}",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.debug("CampingCareAPI: License plate check successful: %s", data)
-                        return {"success": True, "data": data}
-                    else:
-                        _LOGGER.error("CampingCareAPI: API error: %s", response.status)
-                        return {"success": False, "error": f"API error: {response.status}"}
+            status, data = await self._request(
+                ApiEndpoints.CHECK_LICENSE_PLATE,
+                ApiEndpoints.CHECK_LICENSE_PLATE.format(plate=plate),
+            )
+            if status == 200:
+                _LOGGER.debug("CampingCareAPI: License plate check successful: %s", data)
+                return {"success": True, "data": data}
+            else:
+                _LOGGER.error("CampingCareAPI: API error: %s", status)
+                return {"success": False, "error": f"API error: {status}"}
         except ClientError as e:
             _LOGGER.error("CampingCareAPI: API request failed: %s", e)
             return {"success": False, "error": str(e)}
-        
-    async def query_license_plate(self, plate: str) -> dict:
-        """Search for a license plate and retrieve the associated reservation."""
+
+    async def query_license_plate(self, plate: str, full: bool = False) -> dict:
+        """Search for a license plate and retrieve the associated reservation (cached).
+
+        The data is a list of ReservationSummary objects; with ``full`` it is
+        the complete license plate items as returned by the API. The plate is
+        sent normalized, so the cache key is exactly what was asked.
+        """
+        plate = normalize_plate(plate)
+        key = ("query_full" if full else "query", plate)
+        result = await self._cache.get_or_fetch(
+            key,
+            lambda: self._fetch_query_license_plate(plate, full),
+            _query_ttl,
+        )
+        return self._stale_on_failure(key, result)
+
+    async def _fetch_query_license_plate(self, plate: str, full: bool = False) -> dict:
+        """Search the API for a license plate and its reservation."""
         try:
-            async with ClientSession() as session:
-                # Construct the endpoint with query parameters
-                endpoint = f"{self.api_url}{ApiEndpoints.FIND_LICENSE_PLATE_AND_GET_RESERVATION.format(plate=plate)}"
-                async with session.get(
-                    endpoint,
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # _LOGGER.debug("CampingCareAPI: License plate search successful: %s", data)
-                        
-                        # Check if the response is a list
-                        if isinstance(data, list):
-                            if len(data) > 0:
-                                for item in data:
-                                    _LOGGER.info("Reservation found: Kategorie: %s, Platznummer: %s", 
-                                                 item.get("reservation", {}).get("accommodation", {}).get("name", "Unknown"), 
-                                                 item.get("reservation", {}).get("place", {}).get("name", "Unknown"))
-                                return {"success": True, "data": data}
-                            else:
-                                _LOGGER.warning("CampingCareAPI: No reservation found for plate: %s", plate)
-                                return {"success": False, "error": "No reservation found"}
-                        
-                        # Handle unexpected response formats
-                        _LOGGER.error("CampingCareAPI: Unexpected response format: %s", data)
-                        return {"success": False, "error": "Unexpected response format"}
-                    
-                    elif response.status == 404:
-                        _LOGGER.warning("CampingCareAPI: No reservation found for plate: %s", plate)
-                        return {"success": False, "error": "No reservation found"}
+            status, data = await self._request(
+                ApiEndpoints.FIND_LICENSE_PLATE_AND_GET_RESERVATION,
+                ApiEndpoints.FIND_LICENSE_PLATE_AND_GET_RESERVATION.format(plate=plate),
+                # Project each item while the body streams in, so the embedded
+                # reservations are never held in memory all at once
+                parse=None if full else _parse_summaries,
+            )
+            if status == 200:
+                # _LOGGER.debug("CampingCareAPI: License plate search successful: %s", data)
+
+                # Check if the response is a list
+                if isinstance(data, list):
+                    if len(data) > 0:
+                        # Only walk the items when the details will actually be logged
+                        if _LOGGER.isEnabledFor(logging.DEBUG) and not full:
+                            for summary in data:
+                                _LOGGER.debug("Reservation found: Kategorie: %s, Platznummer: %s",
+                                              summary.accommodation or "Unknown",
+                                              summary.place or "Unknown")
+                        return {"success": True, "data": data}
                     else:
-                        _LOGGER.error("CampingCareAPI: API error: %s", response.status)
-                        return {"success": False, "error": f"API error: {response.status}"}
+                        _LOGGER.warning("CampingCareAPI: No reservation found for plate: %s", plate)
+                        return {"success": False, "error": ERROR_NO_RESERVATION}
+
+                # Handle unexpected response formats
+                _LOGGER.error("CampingCareAPI: Unexpected response format: %s", data)
+                return {"success": False, "error": "Unexpected response format"}
+
+            elif status == 404:
+                _LOGGER.warning("CampingCareAPI: No reservation found for plate: %s", plate)
+                return {"success": False, "error": ERROR_NO_RESERVATION}
+            else:
+                _LOGGER.error("CampingCareAPI: API error: %s", status)
+                return {"success": False, "error": f"API error: {status}"}
         except ClientError as e:
             _LOGGER.error("CampingCareAPI: API request failed: %s", e)
             return {"success": False, "error": str(e)}
-        
+        except ValueError as e:
+            # Malformed or truncated JSON body
+            _LOGGER.error("CampingCareAPI: Unexpected response format: %s", e)
+            return {"success": False, "error": "Unexpected response format"}
+
+    def _stale_on_failure(self, key: tuple, result: dict) -> dict:
+        """Serve the last known successful answer when a lookup could not reach the API."""
+        if result["success"] or result["error"] == ERROR_NO_RESERVATION:
+            return result
+        stale = self._cache.get_stale(key)
+        if stale is not None and stale["success"]:
+            _LOGGER.debug("CampingCareAPI: Serving stale %s result for %s", *key)
+            return {**stale, "stale": True}
+        return result
+
     async def get_reservation(self, reservation_id: str) -> dict:
-        """Retrieve a reservation by its ID."""
+        """Retrieve a reservation by its ID.
+
+        Concurrent requests for the same reservation share one API call, and
+        bursts are collected for a few milliseconds and dispatched together.
+        """
+        return await self._reservations.get(str(reservation_id))
+
+    async def _fetch_reservation(self, reservation_id: str) -> dict:
+        """Retrieve a reservation from the API."""
         try:
-            async with ClientSession() as session:
-                # Construct the endpoint with the reservation ID
-                endpoint = f"{self.api_url}{ApiEndpoints.GET_RESERVATION.format(id=reservation_id)}"
-                async with session.get(
-                    endpoint,
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.debug("CampingCareAPI: Reservation retrieval successful: %s", data)
-                        return {"success": True, "data": data}
-                    elif response.status == 404:
-                        _LOGGER.warning("CampingCareAPI: Reservation with ID %s not found.", reservation_id)
-                        return {"success": False, "error": "Reservation not found"}
-                    else:
-                        _LOGGER.error("CampingCareAPI: API error: %s", response.status)
-                        return {"success": False, "error": f"API error: {response.status}"}
+            # Construct the endpoint with the reservation ID
+            status, data = await self._request(
+                ApiEndpoints.GET_RESERVATION,
+                ApiEndpoints.GET_RESERVATION.format(id=reservation_id),
+            )
+            if status == 200:
+                _LOGGER.debug("CampingCareAPI: Reservation retrieval successful: %s", data)
+                return {"success": True, "data": data}
+            elif status == 404:
+                _LOGGER.warning("CampingCareAPI: Reservation with ID %s not found.", reservation_id)
+                return {"success": False, "error": ERROR_RESERVATION_NOT_FOUND}
+            else:
+                _LOGGER.error("CampingCareAPI: API error: %s", status)
+                return {"success": False, "error": f"API error: {status}"}
         except ClientError as e:
             _LOGGER.error("CampingCareAPI: API request failed: %s", e)
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
+
+    async def list_license_plates(
+        self,
+        offset: int,
+        count: int,
+        updated_since: str | None = None,
+        departure_from: str | None = None,
+    ) -> dict:
+        """Retrieve one page of license plates with their reservations."""
+        params = _page_params(offset, count, updated_since, departure_from)
+        params[ApiParams.GET_RESERVATION] = "true"
+        return await self._list_page(ApiEndpoints.LIST_LICENSE_PLATES, params)
+
+    async def list_reservations(
+        self,
+        offset: int,
+        count: int,
+        updated_since: str | None = None,
+        departure_from: str | None = None,
+    ) -> dict:
+        """Retrieve one page of reservations."""
+        params = _page_params(offset, count, updated_since, departure_from)
+        return await self._list_page(ApiEndpoints.LIST_RESERVATIONS, params)
+
+    def iter_license_plates(
+        self,
+        page_size: int = SYNC_PAGE_SIZE,
+        updated_since: str | None = None,
+        departure_from: str | None = None,
+    ) -> AsyncGenerator[list[dict], None]:
+        """Iterate over every page of license plates (see :meth:`_iter_pages`)."""
+        return self._iter_pages(self.list_license_plates, page_size, updated_since, departure_from)
+
+    def iter_reservations(
+        self,
+        page_size: int = SYNC_PAGE_SIZE,
+        updated_since: str | None = None,
+        departure_from: str | None = None,
+    ) -> AsyncGenerator[list[dict], None]:
+        """Iterate over every page of reservations (see :meth:`_iter_pages`)."""
+        return self._iter_pages(self.list_reservations, page_size, updated_since, departure_from)
+
+    async def _iter_pages(
+        self,
+        list_page: Callable[..., Awaitable[dict]],
+        page_size: int,
+        updated_since: str | None,
+        departure_from: str | None,
+    ) -> AsyncGenerator[list[dict], None]:
+        """Yield pages from ``list_page`` until a short page, fetching one page ahead.
+
+        The next page is requested before the current one is handed out, so the
+        caller's processing overlaps the network round trip while at most two
+        pages are held in memory. Raises PageError when a page fails. Callers
+        that stop early should ``aclose()`` the iterator so the prefetched
+        request is cancelled.
+        """
+        offset = 0
+        pending = asyncio.ensure_future(list_page(offset, page_size, updated_since, departure_from))
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if not result["success"]:
+                    raise PageError(f"Page at offset {offset} failed: {result['error']}")
+                page = result["data"]
+                if len(page) >= page_size:
+                    offset += page_size
+                    pending = asyncio.ensure_future(list_page(offset, page_size, updated_since, departure_from))
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _list_page(self, endpoint: ApiEndpoints, params: dict) -> dict:
+        """Retrieve one page of a list endpoint."""
+        try:
+            status, data = await self._request(endpoint, endpoint, params=params)
+            if status == 200:
+                if isinstance(data, list):
+                    _LOGGER.debug(
+                        "CampingCareAPI: Listed %s items from %s at offset %s",
+                        len(data), endpoint, params[ApiParams.OFFSET],
+                    )
+                    return {"success": True, "data": data}
+                _LOGGER.error("CampingCareAPI: Unexpected response format: %s", type(data).__name__)
+                return {"success": False, "error": "Unexpected response format"}
+            else:
+                _LOGGER.error("CampingCareAPI: API error: %s", status)
+                return {"success": False, "error": f"API error: {status}"}
+        except ClientError as e:
+            _LOGGER.error("CampingCareAPI: API request failed: %s", e)
+            return {"success": False, "error": str(e)}
+        except ValueError as e:
+            # Malformed or truncated JSON body
+            _LOGGER.error("CampingCareAPI: Unexpected response format: %s", e)
+            return {"success": False, "error": "Unexpected response format"}
+
+
+def _page_params(offset: int, count: int, updated_since: str | None, departure_from: str | None) -> dict:
+    """Return the query parameters of a list page."""
+    params = {
+        ApiParams.OFFSET: str(offset),
+        ApiParams.COUNT: str(count),
+    }
+    if updated_since:
+        params[ApiParams.UPDATED_SINCE] = updated_since
+    if departure_from:
+        params[ApiParams.DEPARTURE_FROM] = departure_from
+    return params
+
+
+async def _parse_summaries(response: ClientResponse) -> list[ReservationSummary] | Any:
+    """Stream a license plate list into reservation summaries."""
+    return await async_parse_array(
+        response.content.iter_chunked(STREAM_CHUNK_SIZE),
+        ReservationSummary.from_item,
+    )
+
+
+def _query_ttl(result: dict) -> float:
+    """Return how long a query_license_plate result may be cached."""
+    if result["success"]:
+        return CACHE_TTL_QUERY_PLATE
+    if result["error"] == ERROR_NO_RESERVATION:
+        return CACHE_TTL_NOT_FOUND
+    return 0
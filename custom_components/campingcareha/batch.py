@@ -0,0 +1,46 @@
+"""Bounded-concurrency batch execution for plate lookups."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from .matching import normalize_plate
+
+
+async def async_iter_batch(
+    plates: Iterable[str],
+    lookup: Callable[[str], Awaitable[Any]],
+    concurrency: int,
+    timeout: float,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Look up plates concurrently and yield ``(plate, result)`` as each completes.
+
+    Reads that normalize to the same plate are looked up once (the first spelling
+    is kept). At most ``concurrency`` lookups run at a time and each one gets
+    ``timeout`` seconds once it starts; a lookup that times out yields None.
+    Closing the iterator early cancels the lookups that are still pending.
+    """
+    unique: dict[str, str] = {}
+    for plate in plates:
+        normalized = normalize_plate(plate)
+        if normalized:
+            unique.setdefault(normalized, plate)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(plate: str) -> tuple[str, Any]:
+        async with semaphore:
+            try:
+                async with asyncio.timeout(timeout):
+                    return plate, await lookup(plate)
+            except TimeoutError:
+                return plate, None
+
+    tasks = [asyncio.ensure_future(_run(plate)) for plate in unique.values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
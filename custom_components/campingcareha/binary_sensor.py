@@ -0,0 +1,68 @@
+"""Binary sensors for CampingCare HA."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, CONF_NAME
+from .entity import CampingCareEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class CampingCareBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a CampingCare binary sensor."""
+
+    is_on_fn: Callable[[dict], bool]
+
+
+BINARY_SENSORS: tuple[CampingCareBinarySensorEntityDescription, ...] = (
+    CampingCareBinarySensorEntityDescription(
+        key="arrivals_expected",
+        is_on_fn=lambda data: data["arrivals_today"] > 0,
+    ),
+    CampingCareBinarySensorEntityDescription(
+        key="api_reachable",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_fn=lambda data: data["api_reachable"],
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up CampingCare binary sensors from a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        CampingCareBinarySensor(entry_data["coordinator"], entry.entry_id, entry_data[CONF_NAME], description)
+        for description in BINARY_SENSORS
+    )
+
+
+class CampingCareBinarySensor(CampingCareEntity, BinarySensorEntity):
+    """Binary sensor reading one flag of the coordinator summary."""
+
+    entity_description: CampingCareBinarySensorEntityDescription
+
+    def __init__(self, coordinator, entry_id: str, name: str, description: CampingCareBinarySensorEntityDescription):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry_id, name, description.key)
+        self.entity_description = description
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the binary sensor state."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.is_on_fn(self.coordinator.data)
@@ -0,0 +1,125 @@
+"""In-memory lookup cache for the CampingCare API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LookupCache:
+    """Bounded TTL + LRU cache that coalesces concurrent identical fetches."""
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (expired ones included)."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value for ``key`` without touching the counters."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` even if it has expired.
+
+        Expired entries are kept until the LRU evicts them, so the last known
+        answer can still be served while the API is unavailable.
+        """
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds, evicting the least recently used entry."""
+        if ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one entry, or the whole cache when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_for: Callable[[Any], float],
+    ) -> Any:
+        """Return the cached value for ``key`` or fetch it once for all waiters.
+
+        ``ttl_for`` receives the fetched value and returns how long to keep it;
+        returning 0 serves the value to the current waiters without caching it.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fetch(key, fetch, ttl_for))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+        else:
+            self.coalesced += 1
+
+        # Shield so a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_for: Callable[[Any], float],
+    ) -> Any:
+        """Run ``fetch`` and cache its result."""
+        value = await fetch()
+        self.set(key, value, ttl_for(value))
+        return value
+
+    def _fetch_done(self, key: Hashable, task: asyncio.Future) -> None:
+        """Forget a finished in-flight fetch."""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.debug("CampingCareAPI: Cached fetch for %s failed: %s", key, task.exception())
+
+    @property
+    def stats(self) -> dict:
+        """Return the cache counters."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
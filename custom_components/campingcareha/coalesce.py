@@ -0,0 +1,114 @@
+"""Request coalescing and micro-batching for the CampingCare API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestCoalescer:
+    """Collect requests for a few milliseconds and fetch each distinct key once.
+
+    Callers asking for a key that is already waiting for the window, or already
+    being fetched, share that fetch. When the window closes (or ``max_batch``
+    distinct keys are waiting) the batch is dispatched concurrently, at most
+    ``concurrency`` fetches at a time, and every caller is resolved as soon as
+    its own key completes rather than when the whole batch does.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Hashable], Awaitable[Any]],
+        window: float,
+        max_batch: int,
+        concurrency: int,
+    ):
+        """Initialize the coalescer."""
+        self._fetch = fetch
+        self._window = window
+        self._max_batch = max_batch
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._waiting: dict[Hashable, asyncio.Future] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._timer: asyncio.TimerHandle | None = None
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.dispatched = 0
+
+    async def get(self, key: Hashable) -> Any:
+        """Return the fetched value for ``key``, sharing the fetch with concurrent callers."""
+        self.requests += 1
+        future = self._waiting.get(key) or self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = self._waiting[key] = loop.create_future()
+            if len(self._waiting) >= self._max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._flush)
+
+        # Shield so a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    def cancel(self) -> None:
+        """Cancel every waiting and running fetch (e.g. when the client closes)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for future in self._waiting.values():
+            future.cancel()
+        self._waiting = {}
+        for task in self._tasks:
+            task.cancel()
+
+    @property
+    def stats(self) -> dict:
+        """Return the coalescing counters."""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "dispatched": self.dispatched,
+            "avg_batch": round(self.dispatched / self.batches, 2) if self.batches else 0.0,
+        }
+
+    def _flush(self) -> None:
+        """Dispatch every waiting key."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._waiting = self._waiting, {}
+        if not batch:
+            return
+        self.batches += 1
+        self.dispatched += len(batch)
+        _LOGGER.debug("CampingCareAPI: Dispatching a batch of %s coalesced requests", len(batch))
+        for key, future in batch.items():
+            self._inflight[key] = future
+            task = asyncio.ensure_future(self._run(key, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, future: asyncio.Future) -> None:
+        """Fetch one key and resolve its waiters."""
+        try:
+            async with self._semaphore:
+                value = await self._fetch(key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:  # Handed to every waiter of the key
+            if not future.done():
+                future.set_exception(err)
+        else:
+            if not future.done():
+                future.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
@@ -7,7 +7,16 @@ import voluptuous as vol
 from homeassistant.core import callback
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 # from homeassistant.data_entry_flow import FlowResult
-from .const import (DOMAIN, CONF_NAME, CONF_API_KEY, CONF_API_URL, DEFAULT_API_URL)
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_API_KEY,
+    CONF_API_URL,
+    CONF_EVENT_DEDUP_WINDOW,
+    DEFAULT_API_URL,
+    DEFAULT_EVENT_DEDUP_WINDOW,
+    EVENT_DEDUP_MAX_WINDOW,
+)
 
 # _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +77,7 @@ class CampingCareOptionsFlowHandler(OptionsFlow):
         name = self.config_entry.options.get(CONF_NAME, self.config_entry.data.get(CONF_NAME))
         api_url = self.config_entry.options.get(CONF_API_URL, self.config_entry.data.get(CONF_API_URL))
         api_key = self.config_entry.options.get(CONF_API_KEY, self.config_entry.data.get(CONF_API_KEY))
+        dedup_window = self.config_entry.options.get(CONF_EVENT_DEDUP_WINDOW, DEFAULT_EVENT_DEDUP_WINDOW)
 
         return self.async_show_form(
             step_id="init",
@@ -75,5 +85,8 @@ class CampingCareOptionsFlowHandler(OptionsFlow):
                 vol.Required(CONF_NAME, default=name): str,
                 vol.Required(CONF_API_URL, default=api_url): str,
                 vol.Required(CONF_API_KEY, default=api_key): str,
+                vol.Required(CONF_EVENT_DEDUP_WINDOW, default=dedup_window): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=EVENT_DEDUP_MAX_WINDOW)
+                ),
             })
         )
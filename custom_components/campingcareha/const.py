@@ -1,5 +1,6 @@
 """Constants for Camping Care HA integration."""
 from __future__ import annotations
+from datetime import timedelta
 from enum import StrEnum
 
 DOMAIN = "campingcareha"
@@ -7,8 +8,100 @@ DOMAIN = "campingcareha"
 CONF_API_KEY = "api_key"
 CONF_API_URL = "api_url"
 CONF_NAME = "name"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_EVENT_DEDUP_WINDOW = "event_dedup_window"
+
+# Service/websocket target selection (one config entry per park or API key)
+ATTR_ENTRY_ID = "entry_id"
+ATTR_SITE = "site"
+ATTR_FULL = "full"  # Return complete reservations instead of summaries
+
+DATA_ROUTER = f"{DOMAIN}_router"
 
 DEFAULT_API_URL = "https://api.camping.care/v21"
+DEFAULT_EVENT_DEDUP_WINDOW = 0  # Seconds an identical lookup event is suppressed (0, the default, disables)
+
+# HTTP connection pool (one per config entry)
+POOL_LIMIT = 20  # Total simultaneous connections
+POOL_LIMIT_PER_HOST = 10  # Simultaneous connections to the API host
+POOL_DNS_CACHE_TTL = 300  # Seconds to cache DNS lookups
+POOL_KEEPALIVE_TIMEOUT = 60  # Seconds to keep idle connections open
+
+# Plate lookup cache
+CACHE_MAX_SIZE = 1024  # Maximum cached lookups per config entry
+CACHE_TTL_CHECK_PLATE = 60  # Seconds to keep check_plate results
+CACHE_TTL_QUERY_PLATE = 60  # Seconds to keep found reservations for a plate
+CACHE_TTL_NOT_FOUND = 15  # Seconds to remember that a plate has no reservation
+
+ERROR_NO_RESERVATION = "No reservation found"
+ERROR_RESERVATION_NOT_FOUND = "Reservation not found"
+ERROR_UNCERTAIN_MATCH = "Uncertain match"  # Only plates an edit away from the read are known
+
+# Request pipeline
+REQUEST_RETRIES = 2  # Extra attempts for idempotent GETs
+REQUEST_BACKOFF_BASE = 0.25  # Seconds, doubled per attempt (full jitter)
+REQUEST_BACKOFF_MAX = 4  # Maximum seconds between attempts
+REQUEST_CONNECT_TIMEOUT = 3  # Default seconds to establish a connection
+REQUEST_READ_TIMEOUT = 8  # Default seconds to wait for response data
+SETUP_VALIDATE_TIMEOUT = 10  # Seconds setup waits for the API when there is no local snapshot
+STREAM_CHUNK_SIZE = 16384  # Bytes read at a time when streaming a response body
+BREAKER_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+BREAKER_RESET_TIMEOUT = 30  # Seconds the circuit stays open before a probe
+RATE_LIMIT_PER_SECOND = 10  # Sustained requests per second
+RATE_LIMIT_BURST = 20  # Requests allowed in a burst
+RATE_LIMIT_MAX_PAUSE = 60  # Longest Retry-After honoured, in seconds
+RATE_LIMIT_MAX_WAIT = REQUEST_BACKOFF_MAX  # Seconds a request waits out a pause before failing fast
+METRICS_WINDOW = 512  # Latency samples kept per endpoint for percentiles
+
+# Local reservation index sync (driven by the coordinator)
+SYNC_INTERVAL = timedelta(minutes=5)  # Incremental sync interval during the arrival window
+SYNC_INTERVAL_BUSY = timedelta(minutes=2)  # Interval while the API keeps reporting changes
+SYNC_INTERVAL_IDLE = timedelta(minutes=15)  # Interval outside the arrival window
+COORDINATOR_JITTER = 0.1  # +/- fraction applied to every interval
+ARRIVAL_WINDOW_START = 7  # Hour (local time) the arrival window opens
+ARRIVAL_WINDOW_END = 22  # Hour (local time) the arrival window closes
+SYNC_FULL_INTERVAL = timedelta(hours=6)  # Full resync interval (drops deleted plates)
+SYNC_PAGE_SIZE = 100  # License plates fetched per page
+SYNC_OVERLAP = timedelta(minutes=1)  # Overlap of incremental windows to absorb clock skew
+
+# Arrival prefetch
+PREFETCH_LEAD = timedelta(minutes=30)  # Run this long before the arrival window opens
+PREFETCH_CONCURRENCY = 4  # Reservations fetched at the same time
+PREFETCH_RATE_PER_SECOND = 2  # Reservations fetched per second at most
+
+# On-disk snapshot of the reservation index
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # Seconds to collect changes before writing the snapshot
+
+# Pushed changes (webhook event types)
+WEBHOOK_LICENSE_PLATE_UPDATED = "license_plate.updated"
+WEBHOOK_LICENSE_PLATE_DELETED = "license_plate.deleted"
+WEBHOOK_RESERVATION_UPDATED = "reservation.updated"
+WEBHOOK_RESERVATION_DELETED = "reservation.deleted"
+
+# Fuzzy plate matching
+MATCH_MAX_DISTANCE = 1  # Edits allowed after folding OCR-confusable characters
+MATCH_MAX_CANDIDATES = 5  # Candidates returned for a camera read
+
+# Batch plate lookups
+BATCH_CONCURRENCY = 8  # Plates looked up at the same time
+BATCH_TIMEOUT = 10  # Seconds allowed per plate lookup
+BATCH_MAX_PLATES = 200  # Maximum plates per batch request
+
+# get_reservation coalescing
+RESERVATION_BATCH_WINDOW = 0.005  # Seconds to collect reservation requests before dispatching
+RESERVATION_BATCH_MAX = 25  # Distinct reservations that dispatch a batch right away
+RESERVATION_BATCH_CONCURRENCY = 8  # Reservations fetched at the same time
+
+# Gate decisions (is_plate_allowed)
+GATE_LATENCY_BUDGET = 0.08  # Seconds a decision may take, API fallback included
+GATE_ARRIVAL_GRACE = timedelta(days=0)  # Plates pass this long before the arrival day
+GATE_DEPARTURE_GRACE = timedelta(days=0)  # Plates pass this long after the departure day
+GATE_DENIED_STATUSES = frozenset({"cancelled", "canceled", "declined", "rejected", "no_show", "deleted"})
+
+# Event bus deduplication
+EVENT_DEDUP_MAX_WINDOW = 3600  # Largest window accepted in the options
+EVENT_DEDUP_MAX_KEYS = 1024  # Plates/reservations remembered per config entry
 
 
 class ApiTopics(StrEnum):
@@ -23,15 +116,33 @@ class ApiQuery(StrEnum):
     LICENSE_PLATE = "license_plate={plate}"  # Query parameter for license plate in search
     ID = "/{id}"  # Placeholder for ID in URL
 
+class ApiParams(StrEnum):
+    """API query parameter names for list endpoints."""
+    OFFSET = "offset"  # Index of the first item of a page
+    COUNT = "count"  # Page size
+    GET_RESERVATION = "get_reservation"  # Embed the reservation in license plate items
+    UPDATED_SINCE = "updated_since"  # Only items modified after this timestamp
+    DEPARTURE_FROM = "departure_from"  # Only reservations departing on/after this date
+
 class ApiEndpoints(StrEnum):
     """API endpoints for Camping Care."""
     # LICENSE PLATES
     FIND_LICENSE_PLATE_AND_GET_RESERVATION = ApiTopics.LICENSE_PLATES + "?" + ApiQuery.LICENSE_PLATE + "&get_reservation=true"  # Search for a license plate and retrieve the associated reservation
     CHECK_LICENSE_PLATE = ApiTopics.LICENSE_PLATES + "/check_plate?" + ApiQuery.PLATE  # Check if a license plate is valid
+    LIST_LICENSE_PLATES = ApiTopics.LICENSE_PLATES  # List license plates (paged, see ApiParams)
 
     #RESERVATIONS
     GET_RESERVATION = ApiTopics.RESERVATIONS + ApiQuery.ID  # Get reservation details by ID
+    LIST_RESERVATIONS = ApiTopics.RESERVATIONS  # List reservations (paged, see ApiParams)
 
     #API
     GET_API_VERSION = ApiTopics.VERSION  # Get the API version
 
+# Per-endpoint (connect, read) timeouts in seconds; others use the defaults above
+REQUEST_TIMEOUTS = {
+    ApiEndpoints.GET_API_VERSION: (5, 10),
+    ApiEndpoints.CHECK_LICENSE_PLATE: (2, 4),
+    ApiEndpoints.FIND_LICENSE_PLATE_AND_GET_RESERVATION: (2, 6),
+    ApiEndpoints.LIST_LICENSE_PLATES: (5, 30),
+    ApiEndpoints.LIST_RESERVATIONS: (5, 30),
+}
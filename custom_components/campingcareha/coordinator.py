@@ -0,0 +1,140 @@
+"""Data update coordinator for CampingCare HA."""
+from __future__ import annotations
+
+import logging
+import random
+from datetime import date, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ARRIVAL_WINDOW_END,
+    ARRIVAL_WINDOW_START,
+    COORDINATOR_JITTER,
+    SYNC_INTERVAL,
+    SYNC_INTERVAL_BUSY,
+    SYNC_INTERVAL_IDLE,
+)
+from .events import EventThrottle
+from .index import ReservationIndex
+from .prefetch import ArrivalPrefetcher
+from .store import ReservationStore
+from .sync import ReservationSync
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def summarize(index: ReservationIndex, today: date) -> dict:
+    """Count today's arrivals, departures and guests on site in the index.
+
+    The index only holds reservations that have a license plate, so these
+    count reservations with a plate, not every reservation of the site. Guests
+    are on site from their arrival day through their departure day.
+    """
+    arrivals = set()
+    departures = set()
+    on_site = set()
+    upcoming = set()
+    for entry in index.entries():
+        if entry.arrival == today:
+            arrivals.add(entry.reservation_id)
+        elif entry.arrival is not None and entry.arrival > today:
+            upcoming.add(entry.reservation_id)
+        if entry.departure == today:
+            departures.add(entry.reservation_id)
+        if (
+            entry.arrival is not None
+            and entry.departure is not None
+            and entry.arrival <= today <= entry.departure
+        ):
+            on_site.add(entry.reservation_id)
+    return {
+        "arrivals_today": len(arrivals),
+        "departures_today": len(departures),
+        "on_site": len(on_site),
+        "upcoming_arrivals": len(upcoming),
+        "known_plates": len(index),
+    }
+
+
+class CampingCareCoordinator(DataUpdateCoordinator[dict]):
+    """Sync the reservation index once per interval and publish its summary.
+
+    Every entity reads from the same refresh, so adding sensors or dashboards
+    does not add API calls. The interval is shortened during the arrival window
+    and while the API keeps reporting changes, lengthened otherwise, and jittered
+    so several installations do not poll in lockstep.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        reservation_sync: ReservationSync,
+        store: ReservationStore,
+        prefetcher: ArrivalPrefetcher,
+        events: EventThrottle,
+    ):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry.entry_id}",
+            update_interval=SYNC_INTERVAL,
+        )
+        self.reservation_sync = reservation_sync
+        self.store = store
+        self.prefetcher = prefetcher
+        self.events = events
+
+    async def _async_update_data(self) -> dict:
+        """Sync the index and summarize it.
+
+        A failed sync does not fail the update: the last known index keeps
+        serving lookups and its summary stays valid, only ``api_reachable``
+        reports the outage.
+        """
+        now = dt_util.now()
+        synced = await self.reservation_sync.async_sync(now)
+        self.update_interval = self._next_interval(now, synced)
+        if synced and self.reservation_sync.last_received:
+            self.store.async_schedule_save()
+
+        data = summarize(self.reservation_sync.index, now.date())
+        data["api_reachable"] = synced
+        data["last_sync"] = self.reservation_sync.last_success
+        data["metrics"] = self.reservation_sync.api.metrics.snapshot()
+        data["cache"] = self.reservation_sync.api.cache_stats
+        data["prefetch"] = self.prefetcher.stats
+        data["events"] = self.events.stats
+        return data
+
+    @callback
+    def async_index_changed(self) -> None:
+        """Persist and republish the summary after a change pushed outside a refresh.
+
+        The poll schedule is left alone so the periodic sync still catches
+        anything the pushed changes missed.
+        """
+        self.store.async_schedule_save()
+        if self.data is not None:
+            self.data = {
+                **self.data,
+                **summarize(self.reservation_sync.index, dt_util.now().date()),
+                "prefetch": self.prefetcher.stats,
+            }
+            self.async_update_listeners()
+
+    def _next_interval(self, now, synced: bool) -> timedelta:
+        """Pick the next polling interval from the time of day and recent changes."""
+        if synced and self.reservation_sync.last_received:
+            base = SYNC_INTERVAL_BUSY
+        elif ARRIVAL_WINDOW_START <= now.hour < ARRIVAL_WINDOW_END:
+            base = SYNC_INTERVAL
+        else:
+            base = SYNC_INTERVAL_IDLE
+        return base * random.uniform(1 - COORDINATOR_JITTER, 1 + COORDINATOR_JITTER)
@@ -0,0 +1,177 @@
+"""Gate decisions: is a plate allowed through the barrier right now."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from .const import GATE_DENIED_STATUSES
+from .index import IndexedReservation, ReservationIndex
+from .matching import PlateCandidate, fold_plate, normalize_plate
+from .models import ReservationSummary, validity_interval
+
+REASON_VALID = "valid"
+REASON_NOT_ARRIVED = "not_arrived"
+REASON_DEPARTED = "departed"
+REASON_CANCELLED = "cancelled"
+REASON_UNKNOWN_PLATE = "unknown_plate"
+REASON_UNCERTAIN_MATCH = "uncertain_match"
+REASON_LOOKUP_FAILED = "lookup_failed"
+REASON_TIMEOUT = "timeout"
+
+# Ranks a cancelled reservation behind any dated one when explaining a denial
+_CANCELLED_DISTANCE = 1 << 30
+
+
+@dataclass(slots=True, frozen=True)
+class GateDecision:
+    """Allow or deny a camera read, with the reservation that decided it."""
+
+    plate: str
+    allowed: bool
+    reason: str
+    source: str
+    match: str | None = None
+    matched_plate: str | None = None
+    reservation_id: str | None = None
+    place: str | None = None
+    valid_from: date | None = None
+    valid_until: date | None = None
+    candidates: tuple[PlateCandidate, ...] = ()
+
+    def as_dict(self) -> dict:
+        """Return the decision as a JSON-serializable service/websocket response."""
+        return {
+            "plate": self.plate,
+            "allowed": self.allowed,
+            "reason": self.reason,
+            "source": self.source,
+            "match": self.match,
+            "matched_plate": self.matched_plate,
+            "reservation_id": self.reservation_id,
+            "place": self.place,
+            "valid_from": self.valid_from.isoformat() if self.valid_from else None,
+            "valid_until": self.valid_until.isoformat() if self.valid_until else None,
+            "candidates": [candidate.as_dict() for candidate in self.candidates],
+        }
+
+
+def decide(
+    read: str,
+    matched_plate: str,
+    reservations: Iterable[IndexedReservation],
+    today: date,
+    source: str,
+    match: str,
+    candidates: tuple[PlateCandidate, ...] = (),
+) -> GateDecision:
+    """Decide on the reservations of a matched plate.
+
+    The plate is allowed when any reservation is active and ``today`` lies in
+    its validity interval. Otherwise the denial names the reservation closest
+    to being valid: the next arrival or the latest departure, and a
+    cancellation only when there is nothing else.
+    """
+    closest: tuple[int, str, IndexedReservation] | None = None
+    for reservation in reservations:
+        valid_from, valid_until = reservation.valid_from, reservation.valid_until
+        if reservation.status and reservation.status.casefold() in GATE_DENIED_STATUSES:
+            distance, reason = _CANCELLED_DISTANCE, REASON_CANCELLED
+        elif valid_from is not None and today < valid_from:
+            distance, reason = (valid_from - today).days, REASON_NOT_ARRIVED
+        elif valid_until is not None and today > valid_until:
+            distance, reason = (today - valid_until).days, REASON_DEPARTED
+        else:
+            distance, reason = -1, REASON_VALID
+        if closest is None or distance < closest[0]:
+            closest = (distance, reason, reservation)
+        if reason == REASON_VALID:
+            break
+
+    if closest is None:
+        return GateDecision(read, False, REASON_UNKNOWN_PLATE, source)
+    _, reason, reservation = closest
+    return GateDecision(
+        plate=read,
+        allowed=reason == REASON_VALID,
+        reason=reason,
+        source=source,
+        match=match,
+        matched_plate=matched_plate,
+        reservation_id=reservation.reservation_id,
+        place=reservation.place,
+        valid_from=reservation.valid_from,
+        valid_until=reservation.valid_until,
+        candidates=candidates,
+    )
+
+
+def decide_local(index: ReservationIndex, read: str, today: date) -> GateDecision | None:
+    """Decide from the local index, or return None if it does not know the read.
+
+    Only a plate identical to the read once OCR-confusable characters are
+    folded can open the gate. When the closest indexed plates are a real edit
+    away the read is denied as ``uncertain_match`` with those candidates.
+    """
+    candidates = tuple(index.match(read))
+    if not candidates:
+        return None
+    best = candidates[0]
+    if not best.certain:
+        return GateDecision(read, False, REASON_UNCERTAIN_MATCH, "index", candidates=candidates)
+    return decide(
+        read, best.plate, index.get(best.plate), today, "index", "exact" if best.exact else "fuzzy", candidates
+    )
+
+
+def decide_summaries(
+    read: str,
+    summaries: list[ReservationSummary],
+    today: date,
+    candidates: tuple[PlateCandidate, ...] = (),
+) -> GateDecision:
+    """Decide from the reservation summaries of an API lookup.
+
+    The API search can return plates that only resemble the read. As with the
+    index, only a plate identical to the read once OCR-confusable characters
+    are folded can open the gate; when the API knows no such plate the read is
+    denied as ``uncertain_match``.
+    """
+    if not summaries:
+        return GateDecision(read, False, REASON_UNKNOWN_PLATE, "api", candidates=candidates)
+    normalized = normalize_plate(read)
+    folded = fold_plate(read)
+    # Plates identical to the read first, then those equal up to confusables
+    matching = sorted(
+        (summary for summary in summaries if fold_plate(summary.plate) == folded),
+        key=lambda summary: summary.plate != normalized,
+    )
+    if not matching:
+        return GateDecision(read, False, REASON_UNCERTAIN_MATCH, "api", candidates=candidates)
+    matched = matching[0].plate
+    return decide(
+        read,
+        matched,
+        (_from_summary(summary) for summary in matching),
+        today,
+        "api",
+        "exact" if matched == normalized else "fuzzy",
+        candidates,
+    )
+
+
+def _from_summary(summary: ReservationSummary) -> IndexedReservation:
+    """Give an API summary the validity interval an index entry carries."""
+    valid_from, valid_until = validity_interval(summary.arrival, summary.departure)
+    return IndexedReservation(
+        plate=summary.plate,
+        reservation_id=summary.reservation_id,
+        place=summary.place,
+        accommodation=summary.accommodation,
+        arrival=summary.arrival,
+        departure=summary.departure,
+        status=summary.status,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        updated=None,
+    )
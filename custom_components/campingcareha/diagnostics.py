@@ -0,0 +1,52 @@
+"""Diagnostics support for CampingCare HA."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_API_KEY, CONF_WEBHOOK_ID
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api_client = entry_data["api_client"]
+    reservation_sync = entry_data["sync"]
+    coordinator = entry_data["coordinator"]
+
+    summary = dict(coordinator.data or {})
+    summary.pop("metrics", None)
+    summary.pop("cache", None)
+    summary.pop("prefetch", None)
+    summary.pop("events", None)
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "api": {
+            "circuit_state": api_client.circuit_state,
+            "metrics": api_client.metrics.snapshot(),
+            "cache": api_client.cache_stats,
+            "reservation_requests": api_client.reservation_stats,
+        },
+        "sync": {
+            **reservation_sync.export_state(),
+            "ready": reservation_sync.ready,
+            "last_error": reservation_sync.last_error,
+            "indexed_plates": len(entry_data["index"]),
+        },
+        "prefetch": entry_data["prefetch"].stats,
+        "events": entry_data["events"].stats,
+        "coordinator": {
+            "update_interval": str(coordinator.update_interval),
+            "last_update_success": coordinator.last_update_success,
+            "summary": summary,
+        },
+    }
@@ -0,0 +1,26 @@
+"""Base entity for CampingCare HA."""
+from __future__ import annotations
+
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import CampingCareCoordinator
+
+
+class CampingCareEntity(CoordinatorEntity[CampingCareCoordinator]):
+    """Entity backed by the CampingCare coordinator."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: CampingCareCoordinator, entry_id: str, name: str, key: str):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_translation_key = key
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=name,
+            manufacturer="CampingCare",
+            entry_type=DeviceEntryType.SERVICE,
+        )
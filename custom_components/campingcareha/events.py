@@ -0,0 +1,82 @@
+"""Deduplicate lookup events before they reach the event bus."""
+from __future__ import annotations
+
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import EVENT_DEDUP_MAX_KEYS
+
+
+class EventThrottle:
+    """Fire an event only when its state changed or the window has passed.
+
+    A camera re-reading a parked car produces the same lookup every few hundred
+    milliseconds. Each event is keyed (plate, reservation id) and compared with
+    the last one fired for that key: an identical state within ``window``
+    seconds is counted as suppressed instead of fired, a changed state is
+    fired right away. After the window an unchanged state fires again, so
+    automations still see a guest who returns later. A window of 0 fires
+    everything. The least recently seen keys are forgotten beyond ``max_keys``.
+    """
+
+    def __init__(self, window: float, max_keys: int = EVENT_DEDUP_MAX_KEYS):
+        """Initialize the throttle."""
+        self.window = window
+        self._max_keys = max_keys
+        self._last: OrderedDict[tuple[str, Hashable], tuple[Any, float]] = OrderedDict()
+        self.fired: Counter[str] = Counter()
+        self.suppressed: Counter[str] = Counter()
+
+    @callback
+    def async_fire(
+        self,
+        hass: HomeAssistant,
+        event_type: str,
+        key: Hashable,
+        event_data: dict,
+        state: Any = None,
+    ) -> bool:
+        """Fire ``event_data`` unless it repeats the last event of ``key``; return whether it fired.
+
+        ``state`` is what is compared between events (``event_data`` when
+        omitted), so fields that differ between identical reads can be left out.
+        """
+        if state is None:
+            state = event_data
+        now = time.monotonic()
+        slot = (event_type, key)
+        last = self._last.get(slot)
+        if last is not None:
+            self._last.move_to_end(slot)
+            if now - last[1] < self.window and last[0] == state:
+                self.suppressed[event_type] += 1
+                return False
+
+        if self.window > 0:
+            self._last[slot] = (state, now)
+            if len(self._last) > self._max_keys:
+                self._last.popitem(last=False)
+        self.fired[event_type] += 1
+        hass.bus.async_fire(event_type, event_data)
+        return True
+
+    @property
+    def stats(self) -> dict:
+        """Return the fired and suppressed counters."""
+        fired = sum(self.fired.values())
+        suppressed = sum(self.suppressed.values())
+        return {
+            "window": self.window,
+            "fired": fired,
+            "suppressed": suppressed,
+            "suppressed_ratio": round(suppressed / (fired + suppressed), 4) if fired + suppressed else 0.0,
+            "tracked": len(self._last),
+            "events": {
+                event_type: {"fired": self.fired[event_type], "suppressed": self.suppressed[event_type]}
+                for event_type in self.fired.keys() | self.suppressed.keys()
+            },
+        }
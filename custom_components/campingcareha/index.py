@@ -0,0 +1,269 @@
+"""Local plate -> reservation index for CampingCare HA."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+from .matching import PlateCandidate, PlateMatcher, normalize_plate
+from .models import ReservationSummary, _first, parse_date, validity_interval
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class IndexedReservation:
+    """A reservation as seen through one of its license plates.
+
+    Only the fields gate decisions and summaries need are kept: the guest data
+    embedded in license plate items is neither held in memory nor persisted.
+    """
+
+    plate: str
+    reservation_id: str
+    place: str | None
+    accommodation: str | None
+    arrival: date | None
+    departure: date | None
+    status: str | None
+    # Gate validity, precomputed so a decision is only two comparisons
+    valid_from: date | None
+    valid_until: date | None
+    updated: str | None
+
+    @classmethod
+    def from_item(cls, item: dict) -> IndexedReservation | None:
+        """Build an entry from a ``/license_plates?get_reservation=true`` item."""
+        reservation = item.get("reservation") or {}
+        plate = _first(item, "license_plate", "plate")
+        reservation_id = _first(reservation, "id")
+        if reservation_id is None:
+            reservation_id = _first(item, "reservation_id")
+        if not plate or reservation_id is None:
+            return None
+        return cls.from_reservation(
+            str(plate),
+            reservation_id,
+            reservation,
+            _first(item, "updated", "updated_at") or _first(reservation, "updated", "updated_at"),
+        )
+
+    @classmethod
+    def from_reservation(
+        cls, plate: str, reservation_id, reservation: dict, updated: str | None = None
+    ) -> IndexedReservation:
+        """Build an entry linking a plate to a reservation object."""
+        arrival = parse_date(_first(reservation, "arrival", "arrival_date"))
+        departure = parse_date(_first(reservation, "departure", "departure_date"))
+        valid_from, valid_until = validity_interval(arrival, departure)
+        return cls(
+            plate=normalize_plate(plate),
+            reservation_id=str(reservation_id),
+            place=(reservation.get("place") or {}).get("name"),
+            accommodation=(reservation.get("accommodation") or {}).get("name"),
+            arrival=arrival,
+            departure=departure,
+            status=_first(reservation, "status"),
+            valid_from=valid_from,
+            valid_until=valid_until,
+            updated=updated,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> IndexedReservation | None:
+        """Rebuild an entry persisted with :meth:`as_dict`, or None if unusable."""
+        plate, reservation_id = data.get("plate"), data.get("reservation_id")
+        if not plate or reservation_id is None:
+            return None
+        arrival = parse_date(data.get("arrival"))
+        departure = parse_date(data.get("departure"))
+        valid_from, valid_until = validity_interval(arrival, departure)
+        return cls(
+            plate=normalize_plate(str(plate)),
+            reservation_id=str(reservation_id),
+            place=data.get("place"),
+            accommodation=data.get("accommodation"),
+            arrival=arrival,
+            departure=departure,
+            status=data.get("status"),
+            valid_from=valid_from,
+            valid_until=valid_until,
+            updated=data.get("updated"),
+        )
+
+    def as_dict(self) -> dict:
+        """Return the JSON-serializable form persisted in the snapshot."""
+        return {
+            "plate": self.plate,
+            "reservation_id": self.reservation_id,
+            "place": self.place,
+            "accommodation": self.accommodation,
+            "arrival": self.arrival.isoformat() if self.arrival else None,
+            "departure": self.departure.isoformat() if self.departure else None,
+            "status": self.status,
+            "updated": self.updated,
+        }
+
+    def summary(self) -> ReservationSummary:
+        """Return the compact form of this entry."""
+        return ReservationSummary(
+            plate=self.plate,
+            reservation_id=self.reservation_id,
+            arrival=self.arrival,
+            departure=self.departure,
+            place=self.place,
+            accommodation=self.accommodation,
+            status=self.status,
+        )
+
+
+class ReservationIndex:
+    """In-memory index of known plates and their reservations."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._plates: dict[str, dict[str, IndexedReservation]] = {}
+        self._matcher = PlateMatcher()
+        # Bumped whenever the set of indexed plates changes
+        self.version = 0
+
+    @classmethod
+    def from_items(cls, items: list[dict], today: date) -> ReservationIndex:
+        """Build an index from license plate items, without reservations departed before ``today``.
+
+        Only touches the new index, so it can run in an executor thread.
+        """
+        index = cls()
+        for item in items:
+            index.add_item(item)
+        index.prune(today)
+        return index
+
+    @classmethod
+    def from_dicts(cls, entries: list[dict], today: date) -> ReservationIndex:
+        """Build an index from persisted entries, like :meth:`from_items`."""
+        index = cls()
+        for data in entries:
+            entry = IndexedReservation.from_dict(data)
+            if entry is not None:
+                index.add(entry)
+        index.prune(today)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed plates."""
+        return len(self._plates)
+
+    def __contains__(self, plate: str) -> bool:
+        """Return whether a plate is indexed."""
+        return normalize_plate(plate) in self._plates
+
+    @property
+    def plates(self):
+        """Return a view of the indexed (normalized) plates."""
+        return self._plates.keys()
+
+    def entries(self):
+        """Iterate over every indexed plate/reservation pair."""
+        for reservations in self._plates.values():
+            yield from reservations.values()
+
+    def add_item(self, item: dict) -> bool:
+        """Index one license plate item; return False if it was unusable."""
+        entry = IndexedReservation.from_item(item)
+        if entry is None:
+            return False
+        self.add(entry)
+        return True
+
+    def add(self, entry: IndexedReservation) -> None:
+        """Index or replace one plate/reservation pair."""
+        if entry.plate not in self._plates:
+            self._plates[entry.plate] = {}
+            self._matcher.add(entry.plate)
+            self.version += 1
+        self._plates[entry.plate][entry.reservation_id] = entry
+
+    def remove(self, plate: str, reservation_id: str | None = None) -> None:
+        """Remove a plate, or only its link to one reservation."""
+        key = normalize_plate(plate)
+        reservations = self._plates.get(key)
+        if reservations is None:
+            return
+        if reservation_id is not None:
+            reservations.pop(str(reservation_id), None)
+        if reservation_id is None or not reservations:
+            del self._plates[key]
+            self._matcher.remove(key)
+            self.version += 1
+
+    def plates_for_reservation(self, reservation_id: str) -> set[str]:
+        """Return the indexed plates linked to a reservation."""
+        reservation_id = str(reservation_id)
+        return {plate for plate, reservations in self._plates.items() if reservation_id in reservations}
+
+    def update_reservation(self, reservation: dict, plates: list[str] | None = None) -> set[str]:
+        """Apply a changed reservation and return the plates it touched.
+
+        Plates already linked to the reservation get the new reservation data.
+        When ``plates`` is given it is the complete list of the reservation's
+        plates: missing links are added and links to other plates are dropped.
+        """
+        reservation_id = str(reservation["id"])
+        current = self.plates_for_reservation(reservation_id)
+        wanted = current if plates is None else {normalize_plate(plate) for plate in plates} - {""}
+
+        for plate in current - wanted:
+            self.remove(plate, reservation_id)
+        for plate in wanted:
+            existing = self._plates.get(plate, {}).get(reservation_id)
+            updated = _first(reservation, "updated", "updated_at") or (existing.updated if existing else None)
+            self.add(IndexedReservation.from_reservation(plate, reservation_id, reservation, updated))
+        return current | wanted
+
+    def remove_reservation(self, reservation_id: str) -> set[str]:
+        """Drop a reservation from every plate and return those plates."""
+        plates = self.plates_for_reservation(reservation_id)
+        for plate in plates:
+            self.remove(plate, reservation_id)
+        return plates
+
+    def get(self, plate: str) -> list[IndexedReservation]:
+        """Return the reservations indexed for a plate."""
+        reservations = self._plates.get(normalize_plate(plate))
+        return list(reservations.values()) if reservations else []
+
+    def lookup(self, plate: str) -> dict | None:
+        """Return a ``query_license_plate`` style result of ReservationSummary objects, or None on a miss.
+
+        Complete license plate items are not kept; ``full`` lookups go to the API.
+        """
+        reservations = self._plates.get(normalize_plate(plate))
+        if not reservations:
+            return None
+        return {"success": True, "data": [entry.summary() for entry in reservations.values()]}
+
+    def match(self, read: str) -> list[PlateCandidate]:
+        """Return indexed plates close to a camera read, best match first."""
+        return self._matcher.match(read)
+
+    def prune(self, today: date) -> int:
+        """Drop reservations that departed before ``today``; return how many."""
+        removed = 0
+        for plate in list(self._plates):
+            reservations = self._plates[plate]
+            for reservation_id, entry in list(reservations.items()):
+                if entry.departure is not None and entry.departure < today:
+                    del reservations[reservation_id]
+                    removed += 1
+            if not reservations:
+                del self._plates[plate]
+                self._matcher.remove(plate)
+                self.version += 1
+        return removed
+
+    def replace(self, other: ReservationIndex) -> None:
+        """Swap in the contents of a freshly built index."""
+        self._plates = other._plates
+        self._matcher = other._matcher
+        self.version += 1
@@ -0,0 +1,166 @@
+"""License plate normalization and fuzzy matching for ANPR reads."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .const import MATCH_MAX_CANDIDATES, MATCH_MAX_DISTANCE
+
+# Characters ANPR cameras commonly confuse, folded onto one representative
+_CONFUSABLE = str.maketrans({
+    "O": "0",
+    "Q": "0",
+    "I": "1",
+    "L": "1",
+    "B": "8",
+    "S": "5",
+    "Z": "2",
+    "G": "6",
+})
+
+
+def normalize_plate(plate: str) -> str:
+    """Return the canonical form of a plate: upper case, letters and digits only."""
+    return "".join(char for char in plate.upper() if char.isalnum())
+
+
+def fold_plate(plate: str) -> str:
+    """Return the normalized plate with OCR-confusable characters folded together."""
+    return normalize_plate(plate).translate(_CONFUSABLE)
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Return the Levenshtein distance of ``a`` and ``b``, or ``limit + 1`` if larger."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def _deletions(value: str, distance: int) -> set[str]:
+    """Return every string obtained by deleting up to ``distance`` characters."""
+    variants = frontier = {value}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants = variants | frontier
+    return variants
+
+
+def _upper_bound(a: str, b: str) -> int:
+    """Return a cheap upper bound of the edit distance of ``a`` and ``b``."""
+    if len(a) == len(b):
+        return sum(char_a != char_b for char_a, char_b in zip(a, b))
+    return max(len(a), len(b))
+
+
+@dataclass(slots=True, frozen=True)
+class PlateCandidate:
+    """A known plate that may correspond to a camera read."""
+
+    plate: str
+    distance: int  # Edit distance after folding confusable characters
+    raw_distance: int  # Edit distance of the normalized strings
+
+    @property
+    def exact(self) -> bool:
+        """Return whether the read matched the plate exactly after normalization."""
+        return self.raw_distance == 0
+
+    @property
+    def certain(self) -> bool:
+        """Return whether the read is this plate up to OCR-confusable characters."""
+        return self.distance == 0
+
+    def as_dict(self) -> dict:
+        """Return the candidate as an event/websocket payload."""
+        return {"plate": self.plate, "distance": self.distance, "raw_distance": self.raw_distance}
+
+
+class PlateMatcher:
+    """Match camera reads against known plates within a bounded edit distance.
+
+    Known plates are stored under their folded form plus every variant with up to
+    ``max_distance`` characters deleted (a symmetric-delete index), so a lookup
+    only touches the few plates sharing a variant with the read instead of
+    scanning all of them.
+    """
+
+    def __init__(self, max_distance: int = MATCH_MAX_DISTANCE):
+        """Initialize an empty matcher."""
+        self._max_distance = max_distance
+        self._plates: dict[str, str] = {}  # normalized -> folded
+        self._variants: dict[str, set[str]] = {}  # variant -> normalized plates
+
+    def __len__(self) -> int:
+        """Return the number of known plates."""
+        return len(self._plates)
+
+    def rebuild(self, plates: Iterable[str]) -> None:
+        """Replace the known plates."""
+        self._plates.clear()
+        self._variants.clear()
+        for plate in plates:
+            self.add(plate)
+
+    def add(self, plate: str) -> None:
+        """Add a known plate."""
+        normalized = normalize_plate(plate)
+        if not normalized or normalized in self._plates:
+            return
+        folded = normalized.translate(_CONFUSABLE)
+        self._plates[normalized] = folded
+        for variant in _deletions(folded, self._max_distance):
+            self._variants.setdefault(variant, set()).add(normalized)
+
+    def remove(self, plate: str) -> None:
+        """Forget a known plate."""
+        normalized = normalize_plate(plate)
+        folded = self._plates.pop(normalized, None)
+        if folded is None:
+            return
+        for variant in _deletions(folded, self._max_distance):
+            plates = self._variants.get(variant)
+            if plates is not None:
+                plates.discard(normalized)
+                if not plates:
+                    del self._variants[variant]
+
+    def match(self, read: str, limit: int = MATCH_MAX_CANDIDATES) -> list[PlateCandidate]:
+        """Return known plates close to ``read``, best match first."""
+        normalized = normalize_plate(read)
+        if not normalized:
+            return []
+        folded = normalized.translate(_CONFUSABLE)
+
+        seen: set[str] = set()
+        for variant in _deletions(folded, self._max_distance):
+            seen.update(self._variants.get(variant, ()))
+
+        candidates = []
+        for plate in seen:
+            known = self._plates[plate]
+            if known == folded:
+                distance = 0
+            else:
+                distance = edit_distance(folded, known, self._max_distance)
+                if distance > self._max_distance:
+                    continue
+            if plate == normalized:
+                raw_distance = 0
+            else:
+                raw_distance = edit_distance(normalized, plate, _upper_bound(normalized, plate))
+            candidates.append(PlateCandidate(plate, distance, raw_distance))
+
+        candidates.sort(key=lambda candidate: (candidate.distance, candidate.raw_distance, candidate.plate))
+        return candidates[:limit]
@@ -0,0 +1,103 @@
+"""Latency and throughput instrumentation for the CampingCare API client."""
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from .const import METRICS_WINDOW
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+
+
+def _percentile(ordered: list[float], pct: float) -> float | None:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[rank], 2)
+
+
+class EndpointMetrics:
+    """Counters and a sliding latency window for one endpoint."""
+
+    __slots__ = ("latencies", "requests", "errors", "timeouts", "retries", "in_flight")
+
+    def __init__(self, window: int):
+        """Initialize empty metrics."""
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.in_flight = 0
+
+    def snapshot(self) -> dict:
+        """Return the counters and latency percentiles (milliseconds)."""
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+        }
+
+
+class ApiMetrics:
+    """Per-endpoint request metrics.
+
+    Recording only appends to a bounded deque and bumps counters; percentiles
+    are computed when a snapshot is taken (diagnostics, sensor refresh), so the
+    request path does not pay for them.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        """Initialize the metrics."""
+        self._window = window
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def _endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics of one endpoint, creating them on first use."""
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = EndpointMetrics(self._window)
+        return metrics
+
+    def start(self, name: str) -> float:
+        """Record the start of a request and return its start time."""
+        metrics = self._endpoint(name)
+        metrics.requests += 1
+        metrics.in_flight += 1
+        return time.perf_counter()
+
+    def retry(self, name: str) -> None:
+        """Count a retried attempt."""
+        self._endpoint(name).retries += 1
+
+    def finish(self, name: str, started: float, outcome: str) -> None:
+        """Record the end of a request started with :meth:`start`."""
+        metrics = self._endpoint(name)
+        metrics.in_flight -= 1
+        metrics.latencies.append((time.perf_counter() - started) * 1000)
+        if outcome == OUTCOME_TIMEOUT:
+            metrics.timeouts += 1
+        elif outcome == OUTCOME_ERROR:
+            metrics.errors += 1
+
+    def snapshot(self) -> dict:
+        """Return per-endpoint metrics plus totals over all endpoints."""
+        endpoints = {name: metrics.snapshot() for name, metrics in self._endpoints.items()}
+        combined = EndpointMetrics(self._window * max(1, len(self._endpoints)))
+        for metrics in self._endpoints.values():
+            combined.latencies.extend(metrics.latencies)
+            combined.requests += metrics.requests
+            combined.errors += metrics.errors
+            combined.timeouts += metrics.timeouts
+            combined.retries += metrics.retries
+            combined.in_flight += metrics.in_flight
+        return {"total": combined.snapshot(), "endpoints": endpoints}
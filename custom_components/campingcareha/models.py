@@ -0,0 +1,187 @@
+"""Compact reservation model and streaming JSON parsing for CampingCare HA."""
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from .const import GATE_ARRIVAL_GRACE, GATE_DEPARTURE_GRACE
+from .matching import normalize_plate
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def parse_date(value) -> date | None:
+    """Parse the date part of an API date/datetime string."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def validity_interval(arrival: date | None, departure: date | None) -> tuple[date | None, date | None]:
+    """Return the first and last day a reservation's plates may pass the gate.
+
+    Both days are inclusive (guests leave on the departure day); an unknown
+    date leaves that side open.
+    """
+    return (
+        arrival - GATE_ARRIVAL_GRACE if arrival else None,
+        departure + GATE_DEPARTURE_GRACE if departure else None,
+    )
+
+
+def _first(data: dict, *keys):
+    """Return the first non-empty value of ``keys`` in ``data``."""
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class ReservationSummary:
+    """The fields of a plate's reservation that gate automations act on.
+
+    License plate items embed the complete reservation (guests, invoices,
+    options, ...); this keeps only what is needed to decide on and announce an
+    arrival, so lookups cache and fire a few hundred bytes instead.
+    """
+
+    plate: str
+    reservation_id: str
+    arrival: date | None
+    departure: date | None
+    place: str | None
+    accommodation: str | None
+    status: str | None
+
+    @classmethod
+    def from_item(cls, item: dict) -> ReservationSummary | None:
+        """Project a ``/license_plates?get_reservation=true`` item, or None if unusable."""
+        if not isinstance(item, dict):
+            return None
+        reservation = item.get("reservation") or {}
+        plate = _first(item, "license_plate", "plate")
+        reservation_id = _first(reservation, "id")
+        if reservation_id is None:
+            reservation_id = _first(item, "reservation_id")
+        if not plate or reservation_id is None:
+            return None
+        return cls(
+            plate=normalize_plate(str(plate)),
+            reservation_id=str(reservation_id),
+            arrival=parse_date(_first(reservation, "arrival", "arrival_date")),
+            departure=parse_date(_first(reservation, "departure", "departure_date")),
+            place=(reservation.get("place") or {}).get("name"),
+            accommodation=(reservation.get("accommodation") or {}).get("name"),
+            status=_first(reservation, "status"),
+        )
+
+    def as_dict(self) -> dict:
+        """Return the summary as JSON-serializable event data."""
+        return {
+            "plate": self.plate,
+            "reservation_id": self.reservation_id,
+            "arrival": self.arrival.isoformat() if self.arrival else None,
+            "departure": self.departure.isoformat() if self.departure else None,
+            "place": self.place,
+            "accommodation": self.accommodation,
+            "status": self.status,
+        }
+
+
+async def async_parse_array(
+    chunks: AsyncIterable[bytes],
+    project: Callable[[Any], Any],
+) -> list | Any:
+    """Parse a JSON body chunk by chunk, projecting each array element as it completes.
+
+    Only the unparsed tail of the body and the projected elements are kept, so
+    the memory used grows with the size of the result rather than the size of
+    the response. Elements projected to None are dropped. A body that is not a
+    JSON array is returned as parsed, unprojected (None for an empty body).
+    Raises ValueError on malformed JSON.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    items: list = []
+    is_array: bool | None = None
+    closed = False
+    # What the array allows next: "first" (element or "]"), "element", "separator"
+    expect = "first"
+
+    def drain(final: bool) -> str:
+        """Consume every complete element at the start of ``buffer``."""
+        nonlocal is_array, closed, expect
+        pos = 0
+        length = len(buffer)
+        while pos < length and not closed:
+            char = buffer[pos]
+            if char in _WHITESPACE:
+                pos += 1
+                continue
+            if is_array is None:
+                is_array = char == "["
+                if not is_array:
+                    return buffer
+                pos += 1
+                continue
+            if expect == "separator":
+                if char == ",":
+                    expect = "element"
+                elif char == "]":
+                    closed = True
+                else:
+                    raise ValueError(f"Expected ',' or ']' at position {pos}")
+                pos += 1
+                continue
+            if char == "]" and expect == "first":
+                closed = True
+                pos += 1
+                break
+            if char in ",]":
+                raise ValueError(f"Expected an array element at position {pos}")
+            try:
+                element, end = _DECODER.raw_decode(buffer, pos)
+            except ValueError:
+                if final:
+                    raise
+                break
+            # Only accept the element once what follows it is known: a number
+            # cut by a chunk boundary ("1." of "1.5e3") decodes as a shorter one
+            following = end
+            while following < length and buffer[following] in _WHITESPACE:
+                following += 1
+            if following == length or buffer[following] not in ",]":
+                if final:
+                    raise ValueError(f"Expected ',' or ']' at position {following}")
+                break
+            projected = project(element)
+            if projected is not None:
+                items.append(projected)
+            expect = "separator"
+            pos = end
+        return buffer[pos:]
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        if is_array is not False and not closed:
+            buffer = drain(False)
+    buffer += decoder.decode(b"", final=True)
+
+    if is_array is None:
+        return None
+    if is_array is False:
+        return json.loads(buffer)
+    buffer = drain(True)
+    if not closed or buffer.strip():
+        raise ValueError("Truncated or trailing data after JSON array")
+    return items
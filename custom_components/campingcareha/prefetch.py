@@ -0,0 +1,145 @@
+"""Refresh the day's expected arrivals before the arrival window opens."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import date, datetime, time as dt_time
+
+from .batch import async_iter_batch
+from .const import (
+    ARRIVAL_WINDOW_END,
+    ARRIVAL_WINDOW_START,
+    BATCH_TIMEOUT,
+    ERROR_RESERVATION_NOT_FOUND,
+    PREFETCH_CONCURRENCY,
+    PREFETCH_LEAD,
+    PREFETCH_RATE_PER_SECOND,
+)
+from .matching import normalize_plate
+from .resilience import TokenBucket
+from .sync import ReservationSync
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def prefetch_time() -> dt_time:
+    """Return the local time of day the daily prefetch runs."""
+    return (datetime.combine(date.min, dt_time(ARRIVAL_WINDOW_START)) - PREFETCH_LEAD).time()
+
+
+class ArrivalPrefetcher:
+    """Make sure every guest due today is a local index hit at the barrier.
+
+    Shortly before the arrival window the index is synced and each reservation
+    arriving today is re-read with ``get_reservation``, so late changes (place,
+    status, cancellations) are in the index before the first read. Requests run
+    with bounded concurrency and their own rate limit on top of the client's,
+    leaving room for live lookups.
+
+    Lookups are reported back with :meth:`record_lookup`: the first successful
+    read of each prefetched plate after a run counts as a hit when it was
+    served from the index, and as a miss when it had to go to the API. Reads of
+    other plates (visitors, guests not due today) are not counted.
+    """
+
+    def __init__(self, reservation_sync: ReservationSync):
+        """Initialize the prefetcher."""
+        self._sync = reservation_sync
+        self._limiter = TokenBucket(PREFETCH_RATE_PER_SECOND, PREFETCH_CONCURRENCY)
+        self._expected: set[str] = set()
+        self._seen: set[str] = set()
+        self.day: date | None = None
+        self.last_run: datetime | None = None
+        self.duration: float | None = None
+        self.reservations = 0
+        self.refreshed = 0
+        self.removed = 0
+        self.failed = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return the last run and the hit rate since."""
+        lookups = self.hits + self.misses
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "duration": self.duration,
+            "reservations": self.reservations,
+            "plates": len(self._expected),
+            "refreshed": self.refreshed,
+            "removed": self.removed,
+            "failed": self.failed,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def is_due(self, now: datetime) -> bool:
+        """Return whether today's prefetch is still missing (e.g. after a restart)."""
+        return self.day != now.date() and prefetch_time() <= now.time() and now.hour < ARRIVAL_WINDOW_END
+
+    async def async_prefetch(self, now: datetime) -> set[str]:
+        """Sync and refresh today's arrivals; return the plates whose data changed."""
+        started = time.perf_counter()
+        today = now.date()
+        index = self._sync.index
+        api = self._sync.api
+
+        if not await self._sync.async_sync(now):
+            _LOGGER.warning("CampingCareHA: Prefetch sync failed, refreshing arrivals from the current index")
+
+        arrivals = {entry.reservation_id for entry in index.entries() if entry.arrival == today}
+
+        async def _fetch(reservation_id: str) -> dict:
+            await self._limiter.acquire()
+            return await api.get_reservation(reservation_id)
+
+        touched: set[str] = set()
+        refreshed = removed = failed = 0
+        async for reservation_id, result in async_iter_batch(
+            arrivals, _fetch, PREFETCH_CONCURRENCY, BATCH_TIMEOUT
+        ):
+            if result is None or (not result["success"] and result["error"] != ERROR_RESERVATION_NOT_FOUND):
+                failed += 1
+            elif not result["success"]:
+                touched |= index.remove_reservation(reservation_id)
+                removed += 1
+            elif isinstance(result["data"], dict):
+                touched |= index.update_reservation({**result["data"], "id": reservation_id})
+                refreshed += 1
+            else:
+                failed += 1
+
+        for plate in touched:
+            api.invalidate_cache(plate)
+
+        self._expected = {entry.plate for entry in index.entries() if entry.arrival == today}
+        self._seen = set()
+        self.day = today
+        self.last_run = now
+        self.duration = round(time.perf_counter() - started, 3)
+        self.reservations = len(arrivals)
+        self.refreshed = refreshed
+        self.removed = removed
+        self.failed = failed
+        self.hits = self.misses = 0
+        _LOGGER.info(
+            "CampingCareHA: Prefetched %s arrivals (%s plates) in %.1fs: %s refreshed, %s cancelled, %s failed",
+            len(arrivals), len(self._expected), self.duration, refreshed, removed, failed,
+        )
+        return touched
+
+    def record_lookup(self, plate: str, source: str, success: bool) -> None:
+        """Count the first successful lookup of a prefetched plate as a hit or miss."""
+        if not success or self.day is None:
+            return
+        plate = normalize_plate(plate)
+        if plate not in self._expected or plate in self._seen:
+            return
+        self._seen.add(plate)
+        if source == "api":
+            self.misses += 1
+        else:
+            self.hits += 1
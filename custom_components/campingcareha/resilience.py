@@ -0,0 +1,146 @@
+"""Retry, circuit breaker and rate limiting helpers for the CampingCare API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+
+from aiohttp import ClientError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ClientError):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class RateLimitedError(ClientError):
+    """Raised instead of waiting while requests are paused for longer than a caller may wait."""
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Return a full-jitter exponential backoff delay for a retry attempt (0-based)."""
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Fail fast after repeated upstream failures.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and every
+    call is rejected for ``reset_timeout`` seconds. It then lets a single probe
+    through (half-open): success closes it again, failure re-opens it. A probe
+    that ends without either (rate limited, cancelled, unreadable answer) is
+    handed back with :meth:`release_probe`; one that is never handed back
+    expires after ``reset_timeout`` so the breaker cannot stay stuck.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._probe_started = 0.0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Return ``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return "half_open"
+        return "open"
+
+    def check(self) -> bool:
+        """Raise CircuitOpenError unless a call may go through; return whether it is the probe."""
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half_open" and (
+            not self._probing or self._clock() - self._probe_started >= self._reset_timeout
+        ):
+            self._probing = True
+            self._probe_started = self._clock()
+            return True
+        self.rejected += 1
+        raise CircuitOpenError("CampingCare API unavailable (circuit open)")
+
+    def release_probe(self) -> None:
+        """Let another call probe; the last probe ended without a recorded outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self._opened_at is not None:
+            _LOGGER.info("CampingCareAPI: API recovered, closing circuit breaker.")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the breaker at the threshold."""
+        self._failures += 1
+        if self._probing or (self._opened_at is None and self._failures >= self._failure_threshold):
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "CampingCareAPI: %s consecutive failures, failing fast for %ss.",
+                    self._failures, self._reset_timeout,
+                )
+            self._opened_at = self._clock()
+        self._probing = False
+
+
+class TokenBucket:
+    """Client-side rate limiter that can also be paused by a 429 Retry-After."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize a full bucket refilled at ``rate`` tokens per second."""
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds`` (e.g. from a Retry-After header)."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    async def acquire(self, max_wait: float | None = None) -> None:
+        """Wait until a request may be sent.
+
+        Raises RateLimitedError right away when a pause outlasts ``max_wait``
+        seconds, so callers can fall back instead of queueing behind it.
+        """
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    if max_wait is not None and self._blocked_until - now > max_wait:
+                        raise RateLimitedError(
+                            f"CampingCare API rate limited for {self._blocked_until - now:.0f}s"
+                        )
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def retry_after(value: str | None, maximum: float) -> float | None:
+    """Parse a Retry-After header given in seconds, capped at ``maximum``."""
+    if not value:
+        return None
+    try:
+        return min(maximum, max(0.0, float(value)))
+    except ValueError:
+        return None
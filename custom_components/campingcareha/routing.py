@@ -0,0 +1,143 @@
+"""Route lookups to the config entries (parks / API keys) that can answer them."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_ENTRY_ID,
+    ATTR_SITE,
+    CONF_NAME,
+    DATA_ROUTER,
+    DOMAIN,
+    ERROR_NO_RESERVATION,
+    ERROR_RESERVATION_NOT_FOUND,
+    ERROR_UNCERTAIN_MATCH,
+)
+from .matching import normalize_plate
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failures that only mean "this entry does not know it"
+_MISSES = (ERROR_NO_RESERVATION, ERROR_UNCERTAIN_MATCH, ERROR_RESERVATION_NOT_FOUND)
+
+
+class PlateRouter:
+    """Plate -> config entry table built from the entries' local indexes.
+
+    The table is rebuilt lazily, only when an entry was added or removed or an
+    index gained or lost plates since the last lookup, so routing a plate is a
+    single dict lookup.
+    """
+
+    def __init__(self):
+        """Initialize an empty routing table."""
+        self._routes: dict[str, tuple[str, ...]] = {}
+        self._versions: dict[str, tuple[int, int]] = {}
+
+    def route(self, entries: dict[str, dict], plate: str) -> tuple[str, ...]:
+        """Return the ids of the entries whose index holds ``plate``."""
+        self._refresh(entries)
+        return self._routes.get(normalize_plate(plate), ())
+
+    def _refresh(self, entries: dict[str, dict]) -> None:
+        """Rebuild the table if any index changed."""
+        versions = {
+            entry_id: (id(entry_data["index"]), entry_data["index"].version)
+            for entry_id, entry_data in entries.items()
+        }
+        if versions == self._versions:
+            return
+
+        routes: dict[str, list[str]] = {}
+        for entry_id, entry_data in entries.items():
+            for plate in entry_data["index"].plates:
+                routes.setdefault(plate, []).append(entry_id)
+        self._routes = {plate: tuple(entry_ids) for plate, entry_ids in routes.items()}
+        self._versions = versions
+        _LOGGER.debug(
+            "CampingCareHA: Routing %s plates over %s entries", len(self._routes), len(entries)
+        )
+
+
+def async_get_router(hass: HomeAssistant) -> PlateRouter:
+    """Return the shared plate router."""
+    router = hass.data.get(DATA_ROUTER)
+    if router is None:
+        router = hass.data[DATA_ROUTER] = PlateRouter()
+    return router
+
+
+def select_entries(hass: HomeAssistant, data: dict) -> list[str] | None:
+    """Return the entry ids selected by ``entry_id`` / ``site``, or None if none match.
+
+    Without a selector every loaded entry is selected. ``site`` matches the
+    entry's account name, case-insensitively.
+    """
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = data.get(ATTR_ENTRY_ID)
+    site = data.get(ATTR_SITE)
+
+    if entry_id:
+        selected = [entry_id] if entry_id in entries else []
+    elif site:
+        site = site.casefold()
+        selected = [
+            entry_id for entry_id, entry_data in entries.items()
+            if entry_data[CONF_NAME].casefold() == site
+        ]
+    else:
+        selected = list(entries)
+    return selected or None
+
+
+def route_plate(hass: HomeAssistant, entry_ids: list[str], plate: str) -> list[str]:
+    """Narrow the selected entries to those known to hold ``plate``.
+
+    Falls back to every selected entry when no index has the plate, so a
+    fuzzy read or a plate that has not been synced yet is still looked up.
+    """
+    if len(entry_ids) == 1:
+        return entry_ids
+    routed = async_get_router(hass).route(hass.data[DOMAIN], plate)
+    return [entry_id for entry_id in routed if entry_id in entry_ids] or entry_ids
+
+
+async def async_first_success(
+    hass: HomeAssistant,
+    entry_ids: list[str],
+    lookup: Callable[[dict], Awaitable[dict]],
+) -> tuple[str, dict]:
+    """Run ``lookup`` against every entry at once and return the first success.
+
+    The remaining lookups are cancelled as soon as one entry confirms. When all
+    of them fail, a real error wins over a plain "not found" so an outage at one
+    park is not reported as an unknown plate.
+    """
+    entries = hass.data[DOMAIN]
+    if len(entry_ids) == 1:
+        return entry_ids[0], await lookup(entries[entry_ids[0]])
+
+    pending = {asyncio.ensure_future(lookup(entries[entry_id])): entry_id for entry_id in entry_ids}
+    failures: dict[str, dict] = {}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                entry_id = pending.pop(task)
+                result = task.result()
+                if result["success"]:
+                    return entry_id, result
+                failures[entry_id] = result
+    finally:
+        for task in pending:
+            task.cancel()
+
+    # Report in selection order so the answer does not depend on timing
+    for entry_id in entry_ids:
+        if failures[entry_id]["error"] not in _MISSES:
+            return entry_id, failures[entry_id]
+    return entry_ids[0], failures[entry_ids[0]]
@@ -0,0 +1,158 @@
+"""Sensors for CampingCare HA."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, CONF_NAME
+from .entity import CampingCareEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class CampingCareSensorEntityDescription(SensorEntityDescription):
+    """Describes a CampingCare sensor."""
+
+    value_fn: Callable[[dict], Any]
+
+
+SENSORS: tuple[CampingCareSensorEntityDescription, ...] = (
+    CampingCareSensorEntityDescription(
+        key="arrivals_today",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["arrivals_today"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="departures_today",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["departures_today"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="on_site",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["on_site"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="upcoming_arrivals",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["upcoming_arrivals"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="known_plates",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["known_plates"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="last_sync",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["last_sync"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_latency_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["metrics"]["total"]["p50_ms"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["metrics"]["total"]["p95_ms"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_latency_p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["metrics"]["total"]["p99_ms"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["metrics"]["total"]["requests"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["metrics"]["total"]["errors"] + data["metrics"]["total"]["timeouts"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="api_in_flight",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["metrics"]["total"]["in_flight"],
+    ),
+    CampingCareSensorEntityDescription(
+        key="cache_hit_ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: round(data["cache"]["hit_ratio"] * 100, 1),
+    ),
+    CampingCareSensorEntityDescription(
+        key="prefetch_hit_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: (
+            None if data["prefetch"]["hit_rate"] is None else round(data["prefetch"]["hit_rate"] * 100, 1)
+        ),
+    ),
+    CampingCareSensorEntityDescription(
+        key="events_suppressed",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["events"]["suppressed"],
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up CampingCare sensors from a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        CampingCareSensor(entry_data["coordinator"], entry.entry_id, entry_data[CONF_NAME], description)
+        for description in SENSORS
+    )
+
+
+class CampingCareSensor(CampingCareEntity, SensorEntity):
+    """Sensor reading one value of the coordinator summary."""
+
+    entity_description: CampingCareSensorEntityDescription
+
+    def __init__(self, coordinator, entry_id: str, name: str, description: CampingCareSensorEntityDescription):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id, name, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self):
+        """Return the sensor value."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.data)
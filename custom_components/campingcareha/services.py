@@ -0,0 +1,478 @@
+"""Services and WebSocket commands for CampingCare HA.
+
+Registered once for the integration; every call can target one config entry
+(``entry_id``) or site (``site``, the account name). Without a target, plates
+are routed to the entries whose index knows them, and anything unrouted is
+fanned out over all entries with the first confirmed hit answering.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ATTR_ENTRY_ID,
+    ATTR_FULL,
+    ATTR_SITE,
+    BATCH_CONCURRENCY,
+    BATCH_MAX_PLATES,
+    BATCH_TIMEOUT,
+    ERROR_NO_RESERVATION,
+    ERROR_UNCERTAIN_MATCH,
+    GATE_LATENCY_BUDGET,
+)
+from .batch import async_iter_batch
+from .decision import (
+    REASON_LOOKUP_FAILED,
+    REASON_TIMEOUT,
+    REASON_UNCERTAIN_MATCH,
+    REASON_UNKNOWN_PLATE,
+    GateDecision,
+    decide_local,
+    decide_summaries,
+)
+from .matching import normalize_plate
+from .models import ReservationSummary
+from .routing import async_first_success, route_plate, select_entries
+
+_LOGGER = logging.getLogger(__name__)
+
+TARGET_SCHEMA = {
+    vol.Exclusive(ATTR_ENTRY_ID, "target"): cv.string,
+    vol.Exclusive(ATTR_SITE, "target"): cv.string,
+}
+
+
+async def async_lookup_plate(entry_data: dict, plate: str, full: bool = False) -> dict:
+    """Look up a camera read for one config entry and return the event payload.
+
+    The read is matched against the local index first (tolerating separators
+    and OCR-confusable characters); the API is only called when no indexed
+    plate matches that way. A read that only comes within an edit of indexed
+    plates is not reported as a success unless the API confirms it; it fails
+    with ERROR_UNCERTAIN_MATCH and the ranked candidates. The result holds
+    reservation summaries, or the complete items when ``full``; those are not
+    kept locally, so a ``full`` lookup always asks the API (for the indexed
+    plate when the read matched one).
+    """
+    index = entry_data["index"]
+    candidates = index.match(plate)
+    certain = bool(candidates) and candidates[0].certain
+    if certain and not full:
+        source = "index"
+        matched = candidates[0].plate
+        result = index.lookup(matched)
+    else:
+        source = "api"
+        matched = candidates[0].plate if certain else plate
+        result = await entry_data["api_client"].query_license_plate(matched, full)
+        if candidates and not certain and not result["success"] and result["error"] == ERROR_NO_RESERVATION:
+            result = {"success": False, "error": ERROR_UNCERTAIN_MATCH}
+
+    prefetcher = entry_data.get("prefetch")
+    if prefetcher is not None and not full:
+        # Full lookups cannot be served locally and say nothing about the prefetch
+        prefetcher.record_lookup(matched, source, result["success"])
+
+    if not result["success"]:
+        lookup = {"plate": plate, "success": False, "source": source, "error": result["error"]}
+        if candidates:
+            lookup["candidates"] = [candidate.as_dict() for candidate in candidates]
+        return lookup
+    return {
+        "plate": plate,
+        "success": True,
+        "source": source,
+        "match": "fuzzy" if certain and not candidates[0].exact else "exact",
+        "candidates": [candidate.as_dict() for candidate in candidates],
+        "result": result["data"] if full else [summary.as_dict() for summary in result["data"]],
+    }
+
+
+async def async_lookup_any(hass: HomeAssistant, entry_ids: list[str], plate: str, full: bool = False) -> dict:
+    """Look up a read over the selected entries; the payload names the entry that answered."""
+    entry_id, lookup = await async_first_success(
+        hass,
+        route_plate(hass, entry_ids, plate),
+        lambda entry_data: async_lookup_plate(entry_data, plate, full),
+    )
+    return {"entry_id": entry_id, **lookup}
+
+
+async def async_decide_any(hass: HomeAssistant, entry_ids: list[str], plate: str) -> dict:
+    """Decide whether a read may pass the gate now; the response names the entry that decided.
+
+    Every routed entry's index is consulted first, which takes microseconds.
+    Only when no index knows the read for certain (not synced yet, booked since
+    the last sync, or only plates an edit away) is the API asked, within what is
+    left of GATE_LATENCY_BUDGET; a late answer denies with reason ``timeout``
+    while the lookup finishes in the background and warms the cache for the
+    next read. A near miss the API does not confirm is denied as
+    ``uncertain_match`` with the indexed candidates.
+    """
+    started = time.perf_counter()
+    today = dt_util.now().date()
+    routed = route_plate(hass, entry_ids, plate)
+    entries = hass.data[DOMAIN]
+
+    entry_id = None
+    decision = None
+    uncertain = None
+    for candidate_id in routed:
+        local = decide_local(entries[candidate_id]["index"], plate, today)
+        if local is None:
+            continue
+        if local.reason == REASON_UNCERTAIN_MATCH:
+            uncertain = uncertain or (candidate_id, local)
+        elif decision is None or local.allowed:
+            entry_id, decision = candidate_id, local
+            if local.allowed:
+                break
+
+    if decision is None:
+        candidates = uncertain[1].candidates if uncertain else ()
+        try:
+            async with asyncio.timeout(GATE_LATENCY_BUDGET - (time.perf_counter() - started)):
+                entry_id, result = await async_first_success(
+                    hass,
+                    routed,
+                    lambda entry_data: entry_data["api_client"].query_license_plate(plate),
+                )
+        except TimeoutError:
+            decision = GateDecision(plate, False, REASON_TIMEOUT, "api", candidates=candidates)
+        else:
+            if result["success"]:
+                decision = decide_summaries(plate, result["data"], today, candidates)
+            elif result["error"] != ERROR_NO_RESERVATION:
+                decision = GateDecision(plate, False, REASON_LOOKUP_FAILED, "api", candidates=candidates)
+            elif uncertain:
+                entry_id, decision = uncertain
+            else:
+                decision = GateDecision(plate, False, REASON_UNKNOWN_PLATE, "api")
+
+    # Gate reads are most of the traffic the arrival prefetch is meant to serve
+    prefetcher = entries[entry_id].get("prefetch") if entry_id in entries else None
+    if prefetcher is not None:
+        prefetcher.record_lookup(
+            decision.matched_plate or plate, decision.source, decision.matched_plate is not None
+        )
+
+    elapsed = (time.perf_counter() - started) * 1000
+    _LOGGER.debug(
+        "CampingCareHA: Gate decision for %s: %s (%s, %s) in %.2fms",
+        plate, "allow" if decision.allowed else "deny", decision.reason, decision.source, elapsed,
+    )
+    return {"entry_id": entry_id, **decision.as_dict(), "elapsed_ms": round(elapsed, 2)}
+
+
+def _event_data(lookup: dict, full: bool) -> dict:
+    """Return the slim event form of a lookup payload."""
+    if not full:
+        return lookup
+    summaries = (ReservationSummary.from_item(item) for item in lookup["result"])
+    return {**lookup, "result": [summary.as_dict() for summary in summaries if summary is not None]}
+
+
+@callback
+def _async_fire(hass: HomeAssistant, entry_id: str, event_type: str, key: str, event_data: dict, state: Any) -> None:
+    """Fire an event through the entry's throttle, or directly if the entry is gone."""
+    entry_data = hass.data[DOMAIN].get(entry_id)
+    if entry_data is None:
+        hass.bus.async_fire(event_type, event_data)
+        return
+    entry_data["events"].async_fire(hass, event_type, key, event_data, state)
+
+
+@callback
+def _async_fire_lookup(hass: HomeAssistant, lookup: dict, full: bool) -> None:
+    """Fire the query event of a successful lookup unless it repeats the last one.
+
+    Repeated reads of one car differ in the raw read, match and source, so
+    only the matched plate and its reservations are compared.
+    """
+    candidates = lookup["candidates"]
+    plate = normalize_plate(candidates[0]["plate"] if lookup["source"] == "index" else lookup["plate"])
+    event_data = _event_data(lookup, full)
+    _async_fire(
+        hass, lookup["entry_id"], f"{DOMAIN}_query_license_plate", plate, event_data, event_data["result"]
+    )
+
+
+def _timeout_lookup(plate: str) -> dict:
+    """Return the lookup payload for a plate whose lookup timed out."""
+    return {"plate": plate, "success": False, "source": "api", "error": "Timeout"}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services and WebSocket commands."""
+
+    async def handle_check_plate(call: ServiceCall):
+        """Handle the check_plate service."""
+        plate = call.data.get("plate")
+        entry_ids = select_entries(hass, call.data)
+
+        if not entry_ids:
+            _LOGGER.error("No valid CampingCareHA entry found.")
+            return
+
+        entry_id, result = await async_first_success(
+            hass,
+            route_plate(hass, entry_ids, plate),
+            lambda entry_data: entry_data["api_client"].check_license_plate(plate),
+        )
+
+        if result["success"]:
+            _LOGGER.info("CampingCareHA: Plate %s is valid.", plate)
+            _LOGGER.debug("CampingCareHA: Plate %s check result (%s): %s", plate, entry_id, result["data"])
+        else:
+            _LOGGER.warning("CampingCareHA: Plate %s check failed: %s", plate, result["error"])
+
+    async def handle_query_plate(call: ServiceCall) -> ServiceResponse:
+        """Handle the query_plate service.
+
+        The event carries the reservation summaries; the complete reservation
+        is only returned in the service response when ``full`` is set.
+        """
+        plate = call.data.get("plate")
+        full = call.data[ATTR_FULL]
+        entry_ids = select_entries(hass, call.data)
+
+        if not entry_ids:
+            _LOGGER.error("No valid CampingCareHA entry found.")
+            return None
+
+        lookup = await async_lookup_any(hass, entry_ids, plate, full)
+
+        if lookup["success"]:
+            _async_fire_lookup(hass, lookup, full)
+            _LOGGER.info("CampingCareHA: Plate %s is known.", plate)
+        else:
+            _LOGGER.warning("CampingCareHA: Plate %s check failed: %s", plate, lookup["error"])
+        return lookup if call.return_response else None
+
+    async def handle_query_plates(call: ServiceCall) -> ServiceResponse:
+        """Handle the query_plates service (batch of plates)."""
+        plates = call.data["plates"]
+        full = call.data[ATTR_FULL]
+        entry_ids = select_entries(hass, call.data)
+
+        if not entry_ids:
+            _LOGGER.error("No valid CampingCareHA entry found.")
+            return {"results": {}}
+
+        results = {}
+        async for plate, lookup in async_iter_batch(
+            plates,
+            lambda plate: async_lookup_any(hass, entry_ids, plate, full),
+            BATCH_CONCURRENCY,
+            BATCH_TIMEOUT,
+        ):
+            lookup = lookup or _timeout_lookup(plate)
+            results[plate] = lookup
+            # Fire each hit as soon as it is known instead of after the slowest plate
+            if lookup["success"]:
+                _async_fire_lookup(hass, lookup, full)
+
+        _LOGGER.info(
+            "CampingCareHA: Batch query of %s plates, %s known.",
+            len(results), sum(1 for lookup in results.values() if lookup["success"]),
+        )
+        return {"results": results}
+
+    async def handle_get_reservation(call: ServiceCall):
+        """Handle the get_reservation service."""
+        reservation_id = call.data.get("reservation_id")
+        entry_ids = select_entries(hass, call.data)
+
+        if not entry_ids:
+            _LOGGER.error("No valid CampingCareHA entry found.")
+            return
+
+        entry_id, result = await async_first_success(
+            hass,
+            entry_ids,
+            lambda entry_data: entry_data["api_client"].get_reservation(reservation_id),
+        )
+
+        if result["success"]:
+            _async_fire(
+                hass,
+                entry_id,
+                f"{DOMAIN}_get_reservation",
+                reservation_id,
+                {
+                    "entry_id": entry_id,
+                    "reservation_id": reservation_id,
+                    "result": result["data"],
+                },
+                result["data"],
+            )
+            _LOGGER.info("CampingCareHA: Reservation %s retrieved successfully.", reservation_id)
+            _LOGGER.debug("CampingCareHA: Reservation %s: %s", reservation_id, result["data"])
+        else:
+            _LOGGER.warning("CampingCareHA: Failed to retrieve reservation %s: %s", reservation_id, result["error"])
+
+    async def handle_is_plate_allowed(call: ServiceCall) -> ServiceResponse:
+        """Handle the is_plate_allowed service."""
+        plate = call.data["plate"]
+        entry_ids = select_entries(hass, call.data)
+
+        if not entry_ids:
+            _LOGGER.error("No valid CampingCareHA entry found.")
+            return {"entry_id": None, **GateDecision(plate, False, REASON_LOOKUP_FAILED, "none").as_dict()}
+
+        return await async_decide_any(hass, entry_ids, plate)
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="get_reservation",
+        service_func=handle_get_reservation,
+        schema=vol.Schema({
+            vol.Required("reservation_id"): str,
+            **TARGET_SCHEMA,
+        }),
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="check_plate",
+        service_func=handle_check_plate,
+        schema=vol.Schema({
+            vol.Required("plate"): str,
+            **TARGET_SCHEMA,
+        }),
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="query_plate",
+        service_func=handle_query_plate,
+        schema=vol.Schema({
+            vol.Required("plate"): str,
+            vol.Optional(ATTR_FULL, default=False): cv.boolean,
+            **TARGET_SCHEMA,
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="query_plates",
+        service_func=handle_query_plates,
+        schema=vol.Schema({
+            vol.Required("plates"): vol.All(cv.ensure_list, [cv.string], vol.Length(min=1, max=BATCH_MAX_PLATES)),
+            vol.Optional(ATTR_FULL, default=False): cv.boolean,
+            **TARGET_SCHEMA,
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="is_plate_allowed",
+        service_func=handle_is_plate_allowed,
+        schema=vol.Schema({
+            vol.Required("plate"): vol.All(str, vol.Length(min=1)),
+            **TARGET_SCHEMA,
+        }),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    websocket_api.async_register_command(hass, websocket_query_license_plate)
+    websocket_api.async_register_command(hass, websocket_is_plate_allowed)
+    websocket_api.async_register_command(hass, websocket_query_license_plates)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{DOMAIN}/query_license_plate",
+    vol.Required("plate"): vol.All(str, vol.Length(min=1)),
+    **TARGET_SCHEMA,
+})
+@websocket_api.async_response
+async def websocket_query_license_plate(hass: HomeAssistant, connection, msg):
+    """Handle WebSocket license plate lookup."""
+    plate = msg["plate"]
+    _LOGGER.debug("CampingCareHA: WebSocket query_license_plate called with plate: %s", plate)
+
+    entry_ids = select_entries(hass, msg)
+    if not entry_ids:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Missing or invalid entry_id/site")
+        return
+
+    entry_id, result = await async_first_success(
+        hass,
+        route_plate(hass, entry_ids, plate),
+        lambda entry_data: entry_data["api_client"].check_license_plate(plate),
+    )
+
+    if result["success"]:
+        _LOGGER.debug("CampingCareHA: License plate %s is valid (%s): %s", plate, entry_id, result["data"])
+        connection.send_result(msg["id"], result["data"])
+    else:
+        _LOGGER.error("CampingCareHA: License plate %s check failed: %s", plate, result["error"])
+        connection.send_error(msg["id"], "api_error", result["error"])
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{DOMAIN}/is_plate_allowed",
+    vol.Required("plate"): vol.All(str, vol.Length(min=1)),
+    **TARGET_SCHEMA,
+})
+@websocket_api.async_response
+async def websocket_is_plate_allowed(hass: HomeAssistant, connection, msg):
+    """Handle a WebSocket gate decision."""
+    entry_ids = select_entries(hass, msg)
+    if not entry_ids:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Missing or invalid entry_id/site")
+        return
+
+    connection.send_result(msg["id"], await async_decide_any(hass, entry_ids, msg["plate"]))
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{DOMAIN}/query_license_plates",
+    vol.Required("plates"): vol.All([str], vol.Length(min=1, max=BATCH_MAX_PLATES)),
+    vol.Optional(ATTR_FULL, default=False): bool,
+    **TARGET_SCHEMA,
+})
+@callback
+def websocket_query_license_plates(hass: HomeAssistant, connection, msg):
+    """Handle a WebSocket batch license plate lookup.
+
+    The command is acknowledged right away; each plate result is then streamed
+    as an event as soon as it completes, followed by a final ``done`` event.
+    """
+    entry_ids = select_entries(hass, msg)
+    if not entry_ids:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Missing or invalid entry_id/site")
+        return
+
+    async def _async_stream_results():
+        """Send each plate result as it completes."""
+        completed = 0
+        async for plate, lookup in async_iter_batch(
+            msg["plates"],
+            lambda plate: async_lookup_any(hass, entry_ids, plate, msg[ATTR_FULL]),
+            BATCH_CONCURRENCY,
+            BATCH_TIMEOUT,
+        ):
+            completed += 1
+            connection.send_message(websocket_api.event_message(msg["id"], lookup or _timeout_lookup(plate)))
+        connection.send_message(websocket_api.event_message(msg["id"], {"done": True, "completed": completed}))
+        connection.subscriptions.pop(msg["id"], None)
+
+    # Unsubscribing cancels the lookups that are still pending
+    task = hass.async_create_task(_async_stream_results())
+    connection.subscriptions[msg["id"]] = task.cancel
+    connection.send_result(msg["id"])
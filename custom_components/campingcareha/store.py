@@ -0,0 +1,84 @@
+"""On-disk snapshot of the reservation index for CampingCare HA."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .index import ReservationIndex
+from .sync import ReservationSync
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Return the Store holding the snapshot of one config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_remove_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the snapshot of a removed config entry."""
+    await _store(hass, entry_id).async_remove()
+
+
+class ReservationStore:
+    """Persist the reservation index and sync position through HA's Store.
+
+    Writes are debounced: every change only (re)schedules one delayed save, so a
+    burst of sync pages or pushed updates costs a single disk write.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, reservation_sync: ReservationSync):
+        """Initialize the store."""
+        self._hass = hass
+        self._store = _store(hass, entry_id)
+        self._sync = reservation_sync
+
+    async def async_load(self) -> dict | None:
+        """Read the last snapshot, or None if there is none."""
+        return await self._store.async_load() or None
+
+    async def async_restore(self, data: dict) -> int:
+        """Load a snapshot into the index; return the number of plates restored.
+
+        Building the index (and its fuzzy matcher) is the costly part of a
+        restore, so it runs in an executor and the result is swapped in.
+        Snapshots written before only the projected entries were persisted hold
+        complete license plate items; those are projected on restore and
+        dropped by the next save.
+        """
+        index = self._sync.index
+        if "entries" in data:
+            build, entries = ReservationIndex.from_dicts, data["entries"]
+        else:
+            build, entries = ReservationIndex.from_items, data.get("items", [])
+        restored = await self._hass.async_add_executor_job(build, entries, dt_util.now().date())
+        if not len(index):
+            index.replace(restored)
+        else:
+            # Changes pushed while restoring are newer than the snapshot
+            for entry in restored.entries():
+                if entry.plate not in index:
+                    index.add(entry)
+        self._sync.restore_state(data.get("sync", {}))
+        _LOGGER.debug("CampingCareHA: Restored %s plates from the local snapshot", len(index))
+        return len(index)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a debounced write of the current index."""
+        self._store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the current index right away."""
+        await self._store.async_save(self._snapshot())
+
+    def _snapshot(self) -> dict:
+        """Return the data to persist."""
+        return {
+            "sync": self._sync.export_state(),
+            "entries": [entry.as_dict() for entry in self._sync.index.entries()],
+        }
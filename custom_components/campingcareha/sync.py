@@ -0,0 +1,105 @@
+"""Background sync of the local reservation index for CampingCare HA."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+
+from .api import CampingCareAPI, PageError
+from .const import SYNC_FULL_INTERVAL, SYNC_OVERLAP, SYNC_PAGE_SIZE
+from .index import ReservationIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReservationSync:
+    """Keep a ReservationIndex up to date from the license plate list endpoint.
+
+    The first run (and one every SYNC_FULL_INTERVAL) is a full pull into a fresh
+    index that is swapped in when complete, so plates removed upstream disappear.
+    Runs in between only request items modified since the previous run. Pages are
+    applied to the index as they arrive (the next one is already being fetched),
+    so memory does not grow with the result.
+    On failure the previous index is kept and keeps serving lookups.
+    """
+
+    def __init__(self, api: CampingCareAPI, index: ReservationIndex, page_size: int = SYNC_PAGE_SIZE):
+        """Initialize the sync engine."""
+        self._api = api
+        self._page_size = page_size
+        self._lock = asyncio.Lock()
+        self._watermark: datetime | None = None
+        self._last_full: datetime | None = None
+        self.index = index
+        self.last_success: datetime | None = None
+        self.last_error: str | None = None
+        self.last_received = 0
+
+    @property
+    def api(self) -> CampingCareAPI:
+        """Return the API client used for syncing."""
+        return self._api
+
+    @property
+    def ready(self) -> bool:
+        """Return whether at least one full sync has completed."""
+        return self._last_full is not None
+
+    def export_state(self) -> dict:
+        """Return the sync position so it can be persisted with the index."""
+        return {
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "last_full": self._last_full.isoformat() if self._last_full else None,
+        }
+
+    def restore_state(self, state: dict) -> None:
+        """Resume from a persisted sync position (the index is restored separately)."""
+        try:
+            watermark = datetime.fromisoformat(state["watermark"])
+            last_full = datetime.fromisoformat(state["last_full"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self._watermark = watermark
+        self._last_full = last_full
+        self.last_success = watermark
+
+    async def async_sync(self, now: datetime | None = None) -> bool:
+        """Run one full or incremental sync; return whether it succeeded."""
+        async with self._lock:
+            now = now or datetime.now().astimezone()
+            full = self._last_full is None or now - self._last_full >= SYNC_FULL_INTERVAL
+            today = now.date()
+            target = ReservationIndex() if full else self.index
+            since = None if full else (self._watermark - SYNC_OVERLAP).isoformat()
+
+            received = 0
+            pages = self._api.iter_license_plates(self._page_size, since, today.isoformat())
+            try:
+                async for page in pages:
+                    for item in page:
+                        target.add_item(item)
+                    received += len(page)
+            except PageError as err:
+                self.last_error = str(err)
+                _LOGGER.warning(
+                    "CampingCareHA: Reservation sync failed, keeping %s indexed plates: %s",
+                    len(self.index), err,
+                )
+                return False
+            finally:
+                await pages.aclose()
+
+            if full:
+                self.index.replace(target)
+                self._last_full = now
+            pruned = self.index.prune(today)
+            self._watermark = now
+            self.last_success = now
+            self.last_error = None
+            self.last_received = received
+
+            _LOGGER.debug(
+                "CampingCareHA: %s sync received %s items, pruned %s, %s plates indexed",
+                "Full" if full else "Incremental", received, pruned, len(self.index),
+            )
+            return True
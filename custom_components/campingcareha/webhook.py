@@ -0,0 +1,152 @@
+"""Webhook ingestion of CampingCare reservation and license plate changes.
+
+Payloads are JSON, either one change, a list of changes or ``{"events": [...]}``;
+each change is ``{"event": <type>, "data": {...}}``:
+
+- ``license_plate.updated``: ``data`` is a license plate item with its embedded
+  reservation (same shape as the ``/license_plates?get_reservation=true`` list)
+- ``license_plate.deleted``: ``data`` has ``license_plate`` and optionally
+  ``reservation_id`` (without it the plate is dropped from every reservation)
+- ``reservation.updated``: ``data`` is the reservation (with ``id``); an optional
+  ``license_plates`` list replaces the plates linked to it
+- ``reservation.deleted``: ``data`` has the reservation ``id``
+"""
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+
+import voluptuous as vol
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    WEBHOOK_LICENSE_PLATE_DELETED,
+    WEBHOOK_LICENSE_PLATE_UPDATED,
+    WEBHOOK_RESERVATION_DELETED,
+    WEBHOOK_RESERVATION_UPDATED,
+)
+from .index import IndexedReservation, ReservationIndex
+from .matching import normalize_plate
+
+_LOGGER = logging.getLogger(__name__)
+
+CHANGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("event"): vol.In([
+            WEBHOOK_LICENSE_PLATE_UPDATED,
+            WEBHOOK_LICENSE_PLATE_DELETED,
+            WEBHOOK_RESERVATION_UPDATED,
+            WEBHOOK_RESERVATION_DELETED,
+        ]),
+        vol.Required("data"): dict,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+PLATE_DELETED_SCHEMA = vol.Schema(
+    {
+        vol.Required("license_plate"): vol.All(vol.Coerce(str), vol.Length(min=1)),
+        vol.Optional("reservation_id"): vol.Coerce(str),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+RESERVATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("id"): vol.Coerce(str),
+        vol.Optional("license_plates"): [vol.Coerce(str)],
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def apply_change(index: ReservationIndex, change: dict) -> tuple[str | None, set[str]]:
+    """Apply one validated change; return the reservation id and the touched plates.
+
+    Raises vol.Invalid when the change data is unusable.
+    """
+    event = change["event"]
+    data = change["data"]
+
+    if event == WEBHOOK_LICENSE_PLATE_UPDATED:
+        entry = IndexedReservation.from_item(data)
+        if entry is None:
+            raise vol.Invalid("license plate item needs a plate and a reservation id")
+        index.add(entry)
+        return entry.reservation_id, {entry.plate}
+
+    if event == WEBHOOK_LICENSE_PLATE_DELETED:
+        data = PLATE_DELETED_SCHEMA(data)
+        reservation_id = data.get("reservation_id")
+        index.remove(data["license_plate"], reservation_id)
+        return reservation_id, {normalize_plate(data["license_plate"])}
+
+    data = RESERVATION_SCHEMA(data)
+    if event == WEBHOOK_RESERVATION_UPDATED:
+        plates = data.pop("license_plates", None)
+        return data["id"], index.update_reservation(data, plates)
+    return data["id"], index.remove_reservation(data["id"])
+
+
+def async_register_webhook(hass: HomeAssistant, entry: ConfigEntry, name: str, webhook_id: str) -> None:
+    """Register the webhook that feeds changes into one entry's index."""
+
+    async def _async_handle_webhook(hass: HomeAssistant, webhook_id: str, request: web.Request):
+        """Validate a pushed payload and apply it to the local index."""
+        entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if entry_data is None:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST, text="Invalid JSON")
+        if isinstance(payload, dict) and "events" in payload:
+            payload = payload["events"]
+        changes = payload if isinstance(payload, list) else [payload]
+
+        # Validate everything first so a bad payload is rejected as a whole
+        try:
+            changes = [CHANGE_SCHEMA(change) for change in changes]
+        except vol.Invalid as err:
+            return web.Response(status=HTTPStatus.BAD_REQUEST, text=str(err))
+
+        applied = 0
+        for change in changes:
+            try:
+                reservation_id, plates = apply_change(entry_data["index"], change)
+            except vol.Invalid as err:
+                _LOGGER.warning("CampingCareHA: Ignoring invalid %s webhook change: %s", change["event"], err)
+                continue
+            applied += 1
+            for plate in plates:
+                entry_data["api_client"].invalidate_cache(plate)
+            hass.bus.async_fire(
+                f"{DOMAIN}_reservation_updated",
+                {
+                    "entry_id": entry.entry_id,
+                    "event": change["event"],
+                    "reservation_id": reservation_id,
+                    "plates": sorted(plates),
+                },
+            )
+
+        if applied:
+            entry_data["coordinator"].async_index_changed()
+        _LOGGER.debug("CampingCareHA: Applied %s of %s pushed changes", applied, len(changes))
+        return web.json_response({"received": len(changes), "applied": applied})
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"CampingCare {name}",
+        webhook_id,
+        _async_handle_webhook,
+        allowed_methods=["POST"],
+    )
+
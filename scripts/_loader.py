@@ -0,0 +1,49 @@
+"""Import the integration's standalone modules without loading Home Assistant.
+
+The package ``__init__`` pulls in Home Assistant, but the API client and its
+helpers only depend on aiohttp. The dev scripts register a bare package object
+so ``campingcareha.api`` and friends can be imported directly;
+:func:`load_integration` runs the real ``__init__`` when Home Assistant is
+installed.
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "campingcareha"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+
+def load(module: str) -> types.ModuleType:
+    """Return ``campingcareha.<module>`` without executing the package init."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+def load_integration() -> types.ModuleType:
+    """Return the ``campingcareha`` package with its ``__init__`` executed (needs Home Assistant)."""
+    package = sys.modules.get(PACKAGE)
+    if package is None or not hasattr(package, "async_setup_entry"):
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE, PACKAGE_DIR / "__init__.py", submodule_search_locations=[str(PACKAGE_DIR)]
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE] = package
+        spec.loader.exec_module(package)
+    return package
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile (0-100) of ``samples`` using nearest rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
@@ -0,0 +1,105 @@
+"""Time a bulk export: page-by-page requests vs the prefetching page iterator.
+
+Uses the API client standalone (no Home Assistant) on a session owned by the
+script, the way an ETL job would, against the mock API
+(``scripts/mock_server.py``):
+
+    python scripts/bench_export.py --plates 20000 --latency-ms 60 --process-ms 40
+
+* ``sequential``: request a page, process it, request the next one.
+* ``prefetch``: ``iter_license_plates()`` / ``iter_reservations()``, which
+  request the next page while the current one is processed.
+
+``--process-ms`` is the per-page work of the consumer (transforming and
+writing rows). Peak memory is measured with tracemalloc around each export and
+should stay flat as ``--plates`` grows.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from aiohttp import ClientSession
+
+import mock_server
+from _loader import load
+
+api = load("api")
+
+
+async def _process(page: list[dict], process: float) -> int:
+    """Stand in for transforming and writing one page; return its size in bytes."""
+    size = len(json.dumps(page))
+    if process:
+        await asyncio.sleep(process)
+    return size
+
+
+async def _sequential(client, kind: str, page_size: int, process: float) -> tuple[int, int]:
+    """Export every item with one request at a time; return (items, bytes)."""
+    list_page = client.list_license_plates if kind == "license_plates" else client.list_reservations
+    items = written = offset = 0
+    while True:
+        result = await list_page(offset, page_size)
+        if not result["success"]:
+            raise api.PageError(result["error"])
+        page = result["data"]
+        items += len(page)
+        written += await _process(page, process)
+        if len(page) < page_size:
+            return items, written
+        offset += page_size
+
+
+async def _prefetch(client, kind: str, page_size: int, process: float) -> tuple[int, int]:
+    """Export every item through the page iterator; return (items, bytes)."""
+    pages = client.iter_license_plates(page_size) if kind == "license_plates" else client.iter_reservations(page_size)
+    items = written = 0
+    async for page in pages:
+        items += len(page)
+        written += await _process(page, process)
+    return items, written
+
+
+async def main(args: argparse.Namespace) -> None:
+    dataset, config = mock_server.from_arguments(args)
+    app = mock_server.build_app(dataset, config)
+    runner = await mock_server.start(app, "127.0.0.1", args.port)
+    url = f"http://127.0.0.1:{args.port}"
+    print(
+        f"{len(dataset.items)} plates / {len(dataset.reservations)} reservations, "
+        f"{config.latency_ms:.0f}ms latency, {args.process_ms:.0f}ms processing per page of {args.page_size}"
+    )
+    try:
+        async with ClientSession() as session:
+            for kind in ("license_plates", "reservations"):
+                for name, export in (("sequential", _sequential), ("prefetch", _prefetch)):
+                    # The injected session stays open when the client closes
+                    async with api.CampingCareAPI(url, "bench", session=session) as client:
+                        # Lift the client's request rate limit; the mock has no quota
+                        client._rate_limiter = type(client._rate_limiter)(1000, 1000)
+                        tracemalloc.start()
+                        started = time.perf_counter()
+                        items, written = await export(client, kind, args.page_size, args.process_ms / 1000)
+                        elapsed = time.perf_counter() - started
+                        _, peak = tracemalloc.get_traced_memory()
+                        tracemalloc.stop()
+                    print(
+                        f"{kind:>14} {name:>10}: {items:6d} items {written / 1e6:6.1f} MB in {elapsed:6.2f}s "
+                        f"({items / elapsed:7.0f} items/s), peak {peak / 1e6:5.1f} MB"
+                    )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8768)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--process-ms", type=float, default=40.0, help="consumer work per page")
+    mock_server.add_arguments(parser)
+    parser.set_defaults(plates=10000, latency_ms=60.0, jitter_ms=0.0)
+    asyncio.run(main(parser.parse_args()))
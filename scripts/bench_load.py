@@ -0,0 +1,386 @@
+"""Load-test the integration against the mock CampingCare API.
+
+Plate reads are issued open-loop at ``--rate`` per second, the way cameras send
+them whether or not the previous read was answered, with at most
+``--concurrency`` in flight. Latency is measured from the moment a read was due,
+so queueing behind a slow API shows up in the percentiles:
+
+    python scripts/bench_load.py --rate 50 --duration 20 --concurrency 16
+    python scripts/bench_load.py --scenario ws-query --entries 3 --error-rate 0.05
+    python scripts/bench_load.py --json before.json
+    python scripts/bench_load.py --baseline before.json --tolerance 0.2
+
+Without ``--url`` the mock server (``scripts/mock_server.py``) runs in the same
+event loop, which makes absolute numbers pessimistic but keeps runs comparable.
+With ``--baseline`` the script exits with status 1 when a scenario lost more than
+``--tolerance`` of its throughput or its p95 latency grew by more than that;
+only compare runs made with the same options on the same machine.
+
+The ``api-*`` scenarios drive CampingCareAPI directly. The ``service-*``
+scenarios (``service-gate`` calls is_plate_allowed) and ``ws-query`` run the real
+service handlers and WebSocket command against a minimal stand-in for ``hass``;
+they need Home Assistant installed, as in the integration's development
+environment.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import mock_server
+from _loader import PACKAGE_DIR, load, percentile
+
+api = load("api")
+const = load("const")
+index_module = load("index")
+sync_module = load("sync")
+
+API_SCENARIOS = ("api-query", "api-check")
+HASS_SCENARIOS = ("service-query", "service-batch", "service-gate", "ws-query")
+
+# Characters a plate camera commonly confuses
+_OCR_SWAPS = {"0": "O", "O": "0", "1": "I", "I": "1", "8": "B", "B": "8", "5": "S", "S": "5", "2": "Z", "Z": "2"}
+
+
+def _reads(plates: list[str], known: float, noise: float, seed: int) -> Iterator[str]:
+    """Yield camera reads: known plates (some misread) mixed with unknown ones."""
+    rng = random.Random(seed)
+    while True:
+        if rng.random() >= known:
+            yield f"{rng.choice('QWXY')}{rng.choice('QWXY')}-{rng.randint(100, 999)}-{rng.choice('QWXY')}"
+            continue
+        read = rng.choice(plates)
+        if rng.random() < noise:
+            read = read.replace("-", "")
+            swappable = [i for i, char in enumerate(read) if char in _OCR_SWAPS]
+            if swappable:
+                i = rng.choice(swappable)
+                read = read[:i] + _OCR_SWAPS[read[i]] + read[i + 1:]
+        yield read
+
+
+class BenchServices:
+    """Service registry of the ``hass`` stand-in."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._services: dict[str, tuple[Callable, Callable | None]] = {}
+
+    def async_register(self, domain, service, service_func, schema=None, supports_response=None):
+        """Keep the handler and schema of a service."""
+        self._services[service] = (service_func, schema)
+
+    async def async_call(self, service: str, data: dict):
+        """Validate ``data`` and call the handler, asking for its response."""
+        handler, schema = self._services[service]
+        data = schema(data) if schema else data
+        return await handler(SimpleNamespace(data=data, return_response=True))
+
+
+class BenchBus:
+    """Event bus of the ``hass`` stand-in; only counts events."""
+
+    def __init__(self):
+        """Initialize the counters."""
+        self.fired: Counter[str] = Counter()
+
+    def async_fire(self, event_type: str, event_data: dict | None = None) -> None:
+        """Count a fired event."""
+        self.fired[event_type] += 1
+
+
+class BenchHass:
+    """Just enough of HomeAssistant for the service handlers and WebSocket commands."""
+
+    def __init__(self):
+        """Initialize the stand-in."""
+        self.data: dict = {}
+        self.services = BenchServices()
+        self.bus = BenchBus()
+
+    def async_create_task(self, target: Awaitable, name: str | None = None):
+        """Schedule a coroutine on the running loop."""
+        return asyncio.get_running_loop().create_task(target, name=name)
+
+    def async_create_background_task(self, target: Awaitable, name: str, eager_start: bool = False):
+        """Schedule a background coroutine on the running loop."""
+        return self.async_create_task(target, name)
+
+
+class BenchConnection:
+    """WebSocket connection stand-in that resolves a future per message id."""
+
+    def __init__(self):
+        """Initialize the pending results."""
+        self.subscriptions: dict = {}
+        self._pending: dict[int, asyncio.Future] = {}
+
+    def expect(self, msg_id: int) -> asyncio.Future:
+        """Return the future resolved by the answer to ``msg_id``."""
+        future = self._pending[msg_id] = asyncio.get_running_loop().create_future()
+        return future
+
+    def send_result(self, msg_id: int, result=None) -> None:
+        """Resolve a command as successful."""
+        self._resolve(msg_id, True)
+
+    def send_error(self, msg_id: int, code: str, message: str) -> None:
+        """Resolve a command as failed."""
+        self._resolve(msg_id, False)
+
+    def send_message(self, message) -> None:
+        """Ignore streamed events."""
+
+    def _resolve(self, msg_id: int, success: bool) -> None:
+        future = self._pending.pop(msg_id, None)
+        if future is not None and not future.done():
+            future.set_result(success)
+
+
+async def _run(
+    call: Callable[[str], Awaitable[bool]],
+    reads: Iterator[str],
+    rate: float,
+    duration: float,
+    concurrency: int,
+) -> dict:
+    """Issue reads open-loop and return throughput, latency and outcome counts."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def one(read: str, due: float) -> None:
+        async with semaphore:
+            try:
+                outcomes["hit" if await call(read) else "miss"] += 1
+            except Exception:  # noqa: BLE001 - counted, the run goes on
+                outcomes["exception"] += 1
+        latencies.append((time.perf_counter() - due) * 1000)
+
+    total = max(1, int(rate * duration))
+    tasks = []
+    started = time.perf_counter()
+    for i in range(total):
+        due = started + i / rate
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(next(reads), due)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "reads": total,
+        "throughput": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+        **dict(outcomes),
+    }
+
+
+def _allocations(before: tracemalloc.Snapshot, limit: int = 5) -> list[str]:
+    """Return the integration's top allocation sites since ``before``."""
+    after = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, f"{PACKAGE_DIR}/*")]
+    )
+    before = before.filter_traces([tracemalloc.Filter(True, f"{PACKAGE_DIR}/*")])
+    stats = after.compare_to(before, "lineno")
+    return [
+        f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno} "
+        f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d})"
+        for stat in stats[:limit]
+    ]
+
+
+async def _setup_entries(hass: BenchHass, url: str, count: int, warm: bool) -> list:
+    """Create ``count`` entries on the stand-in, optionally syncing their index first."""
+    clients = []
+    for number in range(count):
+        client = api.CampingCareAPI(url, f"bench-{number}")
+        index = index_module.ReservationIndex()
+        reservation_sync = sync_module.ReservationSync(client, index)
+        if warm:
+            started = time.perf_counter()
+            await reservation_sync.async_sync()
+            print(f"  entry {number}: synced {len(index)} plates in {time.perf_counter() - started:.2f}s")
+        hass.data.setdefault(const.DOMAIN, {})[f"bench_{number}"] = {
+            const.CONF_NAME: f"Site {number}",
+            "api_client": client,
+            "index": index,
+            "sync": reservation_sync,
+        }
+        clients.append(client)
+    return clients
+
+
+async def _prepare(
+    name: str, args: argparse.Namespace, url: str, reads: Iterator[str]
+) -> tuple[Callable[[str], Awaitable[bool]], list, BenchHass | None]:
+    """Set up one scenario; return its read handler, its API clients and the hass stand-in."""
+    if name in API_SCENARIOS:
+        client = api.CampingCareAPI(url, "bench")
+        if name == "api-query":
+            async def call(read: str) -> bool:
+                return (await client.query_license_plate(read))["success"]
+        else:
+            async def call(read: str) -> bool:
+                result = await client.check_license_plate(read)
+                return result["success"] and bool(result["data"].get("valid"))
+        return call, [client], None
+
+    services = load("services")
+    events = load("events")
+    hass = BenchHass()
+    clients = await _setup_entries(hass, url, args.entries, args.index == "warm")
+    for entry_data in hass.data[const.DOMAIN].values():
+        entry_data["events"] = events.EventThrottle(args.event_dedup_window)
+    services.async_setup_services(hass)
+
+    if name == "service-query":
+        async def call(read: str) -> bool:
+            return (await hass.services.async_call("query_plate", {"plate": read}))["success"]
+    elif name == "service-gate":
+        async def call(read: str) -> bool:
+            # A decision counts as a success unless it ran out of latency budget
+            return (await hass.services.async_call("is_plate_allowed", {"plate": read}))["reason"] != "timeout"
+    elif name == "service-batch":
+        async def call(read: str) -> bool:
+            plates = [read] + [next(reads) for _ in range(args.batch_size - 1)]
+            response = await hass.services.async_call("query_plates", {"plates": plates})
+            return response["results"][read]["success"]
+    else:
+        connection = BenchConnection()
+        handler = services.websocket_query_license_plate
+        handler = getattr(handler, "__wrapped__", handler)
+        msg_ids = iter(range(1, sys.maxsize))
+
+        async def call(read: str) -> bool:
+            msg_id = next(msg_ids)
+            answer = connection.expect(msg_id)
+            handled = handler(hass, connection, {"id": msg_id, "type": f"{const.DOMAIN}/query_license_plate", "plate": read})
+            if inspect.isawaitable(handled):
+                await handled
+            return await answer
+
+    return call, clients, hass
+
+
+def _regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return the scenarios that got slower than the baseline by more than ``tolerance``."""
+    found = []
+    for name, report in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        if report["throughput"] < before["throughput"] * (1 - tolerance):
+            found.append(f"{name}: throughput {before['throughput']} -> {report['throughput']} reads/s")
+        if report["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            found.append(f"{name}: p95 {before['p95_ms']} -> {report['p95_ms']} ms")
+    return found
+
+
+async def main(args: argparse.Namespace) -> int:
+    dataset, config = mock_server.from_arguments(args)
+    runner = None
+    url = args.url
+    if url is None:
+        app = mock_server.build_app(dataset, config)
+        runner = await mock_server.start(app, "127.0.0.1", args.port)
+        url = f"http://127.0.0.1:{args.port}"
+        print(f"Mock API with {len(dataset.items)} plates at {url}")
+
+    results = {}
+    try:
+        for number, name in enumerate(args.scenario):
+            reads = _reads(dataset.plates, args.known, args.noise, args.seed + number)
+            call, clients, hass = await _prepare(name, args, url, reads)
+            if args.trace_alloc:
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+            report = await _run(call, reads, args.rate, args.duration, args.concurrency)
+            if hass is not None:
+                report["events"] = sum(hass.bus.fired.values())
+            if args.trace_alloc:
+                report["alloc_peak_kib"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                report["alloc_top"] = _allocations(before)
+                tracemalloc.stop()
+
+            metrics = [client.metrics.snapshot()["total"] for client in clients]
+            report["api_requests"] = sum(total["requests"] for total in metrics)
+            report["api_retries"] = sum(total["retries"] for total in metrics)
+            report["cache_hit_ratio"] = round(
+                sum(client.cache_stats["hit_ratio"] for client in clients) / len(clients), 3
+            )
+            # Lookups that lost a fan-out may still be finishing in the background
+            while any(client.metrics.snapshot()["total"]["in_flight"] for client in clients):
+                await asyncio.sleep(0.05)
+            for client in clients:
+                await client.close()
+            results[name] = report
+
+            print(
+                f"{name:<14} reads={report['reads']} {report['throughput']} reads/s "
+                f"p50={report['p50_ms']}ms p95={report['p95_ms']}ms p99={report['p99_ms']}ms "
+                f"max={report['max_ms']}ms hit={report.get('hit', 0)} miss={report.get('miss', 0)} "
+                f"exceptions={report.get('exception', 0)} api={report['api_requests']} "
+                f"retries={report['api_retries']} cache={report['cache_hit_ratio']:.0%}"
+            )
+            if args.trace_alloc:
+                print(f"{'':<14} peak {report['alloc_peak_kib']} KiB; top: " + "; ".join(report["alloc_top"]))
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.baseline:
+        regressions = _regressions(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", action="append", choices=API_SCENARIOS + HASS_SCENARIOS,
+        help="scenario to run, repeatable (default: the api-* scenarios)",
+    )
+    parser.add_argument("--url", help="use a running mock server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate", type=float, default=50.0, help="plate reads per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="reads in flight at most")
+    parser.add_argument("--known", type=float, default=0.8, help="share of reads of known plates")
+    parser.add_argument("--noise", type=float, default=0.1, help="share of known reads misread")
+    parser.add_argument("--entries", type=int, default=1, help="config entries (sites) for hass scenarios")
+    parser.add_argument("--index", choices=("warm", "empty"), default="warm", help="sync the index before hass scenarios")
+    parser.add_argument("--batch-size", type=int, default=10, help="plates per service-batch call")
+    parser.add_argument(
+        "--event-dedup-window", type=float, default=const.DEFAULT_EVENT_DEDUP_WINDOW,
+        help="seconds identical lookup events are suppressed (the entry option)",
+    )
+    parser.add_argument("--trace-alloc", action="store_true", help="report allocations (slows the run)")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare against results written with --json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression against the baseline")
+    parser.add_argument("--log-level", default="ERROR", help="log level of the integration")
+    mock_server.add_arguments(parser)
+    arguments = parser.parse_args()
+    logging.basicConfig(level=arguments.log_level.upper())
+    arguments.scenario = arguments.scenario or list(API_SCENARIOS)
+    sys.exit(asyncio.run(main(arguments)))
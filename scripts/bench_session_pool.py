@@ -0,0 +1,86 @@
+"""Compare plate lookup latency with per-call sessions vs the pooled session.
+
+Starts a local aiohttp stub that mimics ``/license_plates/check_plate`` and
+times sequential lookups through both strategies:
+
+    python scripts/bench_session_pool.py --requests 500 --latency-ms 5
+
+The stub is plain HTTP on loopback, so the gap shown here is only the TCP
+connect and session setup; against api.camping.care the TLS handshake widens it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import ClientSession, web
+
+from _loader import load, percentile
+
+api = load("api")
+const = load("const")
+
+
+def _build_stub(latency: float) -> web.Application:
+    async def check_plate(request: web.Request) -> web.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        return web.json_response({"plate": request.query.get("plate"), "valid": True})
+
+    app = web.Application()
+    app.router.add_get("/license_plates/check_plate", check_plate)
+    return app
+
+
+async def _per_call_lookup(url: str, plate: str) -> None:
+    """Replicate the old client: a fresh ClientSession for every request."""
+    async with ClientSession() as session:
+        async with session.get(
+            f"{url}{const.ApiEndpoints.CHECK_LICENSE_PLATE.format(plate=plate)}",
+            headers={"Authorization": "Bearer bench"},
+        ) as response:
+            await response.json()
+
+
+async def _measure(label: str, lookup, requests: int) -> None:
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await lookup(f"AB{i:05d}CD")
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<12} n={requests} "
+        f"p50={percentile(samples, 50):.2f}ms p99={percentile(samples, 99):.2f}ms "
+        f"total={sum(samples):.0f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    runner = web.AppRunner(_build_stub(args.latency_ms / 1000))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        await _measure(
+            "per-call", lambda plate: _per_call_lookup(url, plate), args.requests
+        )
+
+        client = api.CampingCareAPI(url, "bench")
+        # Measure connection reuse only: go past the lookup cache and lift the
+        # client's request rate limit, which would otherwise throttle the run
+        client._rate_limiter = type(client._rate_limiter)(1e6, 1e6)
+        await _measure("pooled", client._fetch_check_license_plate, args.requests)
+        await client.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8765)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,186 @@
+"""Time config entry setup with and without a local snapshot.
+
+Runs the integration's real ``async_setup_entry`` against the mock API
+(``scripts/mock_server.py``) on a Home Assistant core with a minimal stand-in
+for the config entry and the config entries manager (platforms are not set up):
+
+    python scripts/bench_startup.py --plates 5000 --latency-ms 300
+
+* ``no-snapshot``: first start (the snapshot is removed before each run);
+  setup waits for the API to answer and the index fills from a full sync.
+* ``snapshot``: restart after the previous runs left a snapshot on disk; the
+  API is checked in the background, the index is restored in an executor and
+  an incremental sync catches up (the mock's plates all count as just
+  updated, so it receives every plate again).
+
+For each it reports how long until setup returns, until the index serves
+lookups, until the first sync finished, and the longest event loop stall
+seen by a ticker task (a stall delays every other integration and the
+frontend). Needs Home Assistant installed, as in the integration's
+development environment.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+import mock_server
+from _loader import load_integration
+
+integration = load_integration()
+const = integration.const
+
+TICK = 0.001
+
+
+class StallMonitor:
+    """Measure the longest gap between ticks of a task sleeping ``TICK`` seconds."""
+
+    def __init__(self):
+        self.worst = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _tick(self) -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(TICK)
+            now = time.perf_counter()
+            self.worst = max(self.worst, now - last - TICK)
+            last = now
+
+    def __enter__(self) -> StallMonitor:
+        self._task = asyncio.ensure_future(self._tick())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._task.cancel()
+
+
+class BenchConfigEntries:
+    """Config entries manager stand-in; entity platforms are not part of the measurement."""
+
+    async def async_forward_entry_setups(self, entry, platforms) -> None:
+        """Skip setting up the entity platforms."""
+
+    async def async_unload_platforms(self, entry, platforms) -> bool:
+        """Nothing to unload."""
+        return True
+
+    def async_update_entry(self, entry, data: dict | None = None, options: dict | None = None) -> None:
+        """Store new entry data or options."""
+        if data is not None:
+            entry.data = data
+        if options is not None:
+            entry.options = options
+
+
+class BenchEntry:
+    """Just enough of ConfigEntry for setting up and unloading the integration."""
+
+    def __init__(self, entry_id: str, data: dict):
+        """Initialize the entry."""
+        self.entry_id = entry_id
+        self.data = data
+        self.options: dict = {}
+        self._on_unload: list[Callable[[], None]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        """Call ``func`` when the entry is unloaded."""
+        self._on_unload.append(func)
+
+    def async_create_background_task(self, hass, target: Awaitable, name: str, eager_start: bool = False):
+        """Run ``target`` until it finishes or the entry is unloaded."""
+        task = hass.async_create_background_task(target, name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def async_unload(self, hass) -> None:
+        """Unload the integration and cancel what is left of its background tasks."""
+        await integration.async_unload_entry(hass, self)
+        for func in reversed(self._on_unload):
+            func()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def _wait_for(condition: Callable[[], bool], started: float) -> float:
+    """Return when ``condition`` first holds, in seconds since ``started``."""
+    while not condition():
+        await asyncio.sleep(TICK)
+    return time.perf_counter() - started
+
+
+async def _setup(hass, url: str) -> tuple[BenchEntry, float, float, float]:
+    """Set up one entry; return it and (setup returned, index ready, first sync done) in seconds."""
+    entry = BenchEntry("bench", {
+        const.CONF_NAME: "Bench",
+        const.CONF_API_URL: url,
+        const.CONF_API_KEY: "bench",
+        const.CONF_WEBHOOK_ID: "bench",
+    })
+    started = time.perf_counter()
+    await integration.async_setup_entry(hass, entry)
+    returned = time.perf_counter() - started
+    entry_data = hass.data[const.DOMAIN][entry.entry_id]
+    ready, synced = await asyncio.gather(
+        _wait_for(lambda: len(entry_data["index"]) > 0, started),
+        # The coordinator publishes its first data once the first sync is done
+        _wait_for(lambda: entry_data["coordinator"].data is not None, started),
+    )
+    return entry, returned, ready, synced
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Imported here so the event loop exists when the core is created
+    from homeassistant.core import HomeAssistant
+
+    dataset, config = mock_server.from_arguments(args)
+    runner = await mock_server.start(mock_server.build_app(dataset, config), "127.0.0.1", args.port)
+    url = f"http://127.0.0.1:{args.port}"
+    print(f"{len(dataset.items)} plates, API latency {config.latency_ms:.0f}ms")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = BenchConfigEntries()
+        try:
+            # No-snapshot runs first: unloading saves the snapshot the next case restores
+            for name in ("no-snapshot", "snapshot"):
+                returned, ready, synced, stalls = [], [], [], []
+                for _ in range(args.runs):
+                    if name == "no-snapshot":
+                        await integration.async_remove_store(hass, "bench")
+                    with StallMonitor() as monitor:
+                        entry, done, indexed, caught_up = await _setup(hass, url)
+                    await entry.async_unload(hass)
+                    returned.append(done)
+                    ready.append(indexed)
+                    synced.append(caught_up)
+                    stalls.append(monitor.worst)
+                print(
+                    f"{name:>11}: setup returned {min(returned) * 1000:8.1f}ms  "
+                    f"index ready {min(ready) * 1000:8.1f}ms  "
+                    f"synced {min(synced) * 1000:8.1f}ms  "
+                    f"worst loop stall {max(stalls) * 1000:7.1f}ms"
+                )
+        finally:
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--runs", type=int, default=3, help="runs per case (best is shown)")
+    parser.add_argument("--log-level", default="ERROR", help="log level of the integration")
+    mock_server.add_arguments(parser)
+    parser.set_defaults(plates=5000, latency_ms=300.0, jitter_ms=0.0)
+    arguments = parser.parse_args()
+    logging.basicConfig(level=arguments.log_level.upper())
+    asyncio.run(main(arguments))
@@ -0,0 +1,226 @@
+"""Local stand-in for the CampingCare API with configurable latency and faults.
+
+Serves a generated set of reservations and license plates on the endpoints the
+integration uses (``/version``, ``/license_plates``, ``/license_plates/check_plate``,
+``/reservations`` and ``/reservations/{id}``):
+
+    python scripts/mock_server.py --port 8765 --plates 5000 --latency-ms 40 \
+        --jitter-ms 20 --error-rate 0.02 --rate-limit-rate 0.01
+
+Point a config entry (API URL ``http://<host>:8765``, any API key) or
+``scripts/bench_load.py --url`` at it. The benchmark can also start it in-process.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from aiohttp import web
+
+VERSION = "21.0.0-mock"
+
+
+@dataclass
+class MockConfig:
+    """Latency and fault injection settings."""
+
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 1
+
+
+class MockDataset:
+    """Generated reservations, each with one or two license plates."""
+
+    def __init__(self, plates: int, padding: int = 0, seed: int = 1, today: date | None = None):
+        """Generate ``plates`` plate items around ``today``.
+
+        ``padding`` adds that many bytes of guest notes to every reservation to
+        mimic long-stay reservations with large embedded payloads.
+        """
+        rng = random.Random(seed)
+        today = today or date.today()
+        updated = datetime.now(timezone.utc).isoformat()
+        self.reservations: dict[str, dict] = {}
+        self.items: list[dict] = []
+        self.by_plate: dict[str, list[dict]] = {}
+
+        reservation_id = 1000
+        while len(self.items) < plates:
+            reservation_id += 1
+            arrival = today + timedelta(days=rng.randint(-14, 30))
+            reservation = {
+                "id": reservation_id,
+                "arrival": arrival.isoformat(),
+                "departure": (arrival + timedelta(days=rng.randint(1, 21))).isoformat(),
+                "status": "confirmed",
+                "place": {"name": f"{rng.choice('ABCDEFGH')}{rng.randint(1, 120)}"},
+                "accommodation": {"name": rng.choice(["Pitch", "Chalet", "Mobile home", "Tent"])},
+                "updated": updated,
+                "notes": "x" * padding,
+            }
+            self.reservations[str(reservation_id)] = reservation
+            for _ in range(rng.choice((1, 1, 1, 2))):
+                plate = self._plate(rng)
+                item = {"license_plate": plate, "updated": updated, "reservation": reservation}
+                self.items.append(item)
+                self.by_plate.setdefault(_key(plate), []).append(item)
+
+    @staticmethod
+    def _plate(rng: random.Random) -> str:
+        """Return a random Dutch style plate (e.g. ``AB-123-C``)."""
+        letters = "BDFGHJKLNPRSTVXZ"
+        return (
+            f"{rng.choice(letters)}{rng.choice(letters)}-"
+            f"{rng.randint(100, 999)}-{rng.choice(letters)}"
+        )
+
+    @property
+    def plates(self) -> list[str]:
+        """Return every known plate as written in the items."""
+        return [item["license_plate"] for item in self.items]
+
+    def find(self, plate: str) -> list[dict]:
+        """Return the items of a plate, ignoring case and separators."""
+        return self.by_plate.get(_key(plate), [])
+
+
+def _key(plate: str) -> str:
+    """Return the lookup form of a plate."""
+    return "".join(char for char in plate.upper() if char.isalnum())
+
+
+def build_app(dataset: MockDataset, config: MockConfig) -> web.Application:
+    """Return the mock API application; request counts are kept in ``app["requests"]``."""
+    rng = random.Random(config.seed)
+    requests: Counter[str] = Counter()
+
+    @web.middleware
+    async def faults(request: web.Request, handler):
+        """Delay every request and inject 429 and 5xx answers."""
+        resource = request.match_info.route.resource
+        requests[resource.canonical if resource is not None else request.path] += 1
+        delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            requests["429"] += 1
+            return web.Response(status=429, headers={"Retry-After": str(config.retry_after)})
+        if roll < config.rate_limit_rate + config.error_rate:
+            requests["5xx"] += 1
+            return web.Response(status=rng.choice((500, 502, 503)))
+        return await handler(request)
+
+    async def version(request: web.Request) -> web.Response:
+        return web.Response(text=VERSION)
+
+    async def check_plate(request: web.Request) -> web.Response:
+        plate = request.query.get("plate", "")
+        return web.json_response({"plate": plate, "valid": bool(dataset.find(plate))})
+
+    async def license_plates(request: web.Request) -> web.Response:
+        plate = request.query.get("license_plate")
+        if plate is not None:
+            return web.json_response(dataset.find(plate))
+
+        items = dataset.items
+        if "updated_since" in request.query:
+            items = [item for item in items if item["updated"] > request.query["updated_since"]]
+        if "departure_from" in request.query:
+            items = [
+                item for item in items
+                if item["reservation"]["departure"] >= request.query["departure_from"]
+            ]
+        offset = int(request.query.get("offset", 0))
+        count = int(request.query.get("count", 100))
+        return web.json_response(items[offset:offset + count])
+
+    async def reservations(request: web.Request) -> web.Response:
+        items = list(dataset.reservations.values())
+        if "updated_since" in request.query:
+            items = [item for item in items if item["updated"] > request.query["updated_since"]]
+        if "departure_from" in request.query:
+            items = [item for item in items if item["departure"] >= request.query["departure_from"]]
+        offset = int(request.query.get("offset", 0))
+        count = int(request.query.get("count", 100))
+        return web.json_response(items[offset:offset + count])
+
+    async def reservation(request: web.Request) -> web.Response:
+        found = dataset.reservations.get(request.match_info["id"])
+        if found is None:
+            return web.json_response({"error": "Reservation not found"}, status=404)
+        return web.json_response(found)
+
+    app = web.Application(middlewares=[faults])
+    app["requests"] = requests
+    app.router.add_get("/version", version)
+    app.router.add_get("/license_plates/check_plate", check_plate)
+    app.router.add_get("/license_plates", license_plates)
+    app.router.add_get("/reservations", reservations)
+    app.router.add_get("/reservations/{id}", reservation)
+    return app
+
+
+async def start(app: web.Application, host: str, port: int) -> web.AppRunner:
+    """Serve ``app`` on ``host:port`` and return the runner to clean it up."""
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the dataset and fault injection options to ``parser``."""
+    parser.add_argument("--plates", type=int, default=2000, help="plates in the generated dataset")
+    parser.add_argument("--padding", type=int, default=0, help="bytes of notes per reservation")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 5xx answers")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of 429 answers")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of 429 answers")
+    parser.add_argument("--seed", type=int, default=1)
+
+
+def from_arguments(args: argparse.Namespace) -> tuple[MockDataset, MockConfig]:
+    """Return the dataset and settings selected on the command line."""
+    dataset = MockDataset(args.plates, args.padding, args.seed)
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    return dataset, config
+
+
+async def main(args: argparse.Namespace) -> None:
+    dataset, config = from_arguments(args)
+    app = build_app(dataset, config)
+    runner = await start(app, args.host, args.port)
+    print(f"Mock CampingCare API with {len(dataset.items)} plates on http://{args.host}:{args.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(dict(app["requests"]))
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
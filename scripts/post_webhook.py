@@ -0,0 +1,78 @@
+"""Post reservation/license plate changes to the integration's webhook.
+
+The webhook URL is logged when the integration is set up, e.g.
+
+    python scripts/post_webhook.py http://homeassistant.local:8123/api/webhook/<id> \
+        plate-updated --plate AB-123-CD --reservation 4711 --arrival 2026-07-01 --departure 2026-07-08
+
+    python scripts/post_webhook.py <url> reservation-deleted --reservation 4711
+
+    python scripts/post_webhook.py <url> raw changes.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from aiohttp import ClientSession
+
+
+def _build(args: argparse.Namespace):
+    """Return the JSON payload for the chosen command."""
+    if args.command == "raw":
+        with open(args.file, encoding="utf-8") as file:
+            return json.load(file)
+    if args.command == "plate-updated":
+        return {
+            "event": "license_plate.updated",
+            "data": {
+                "license_plate": args.plate,
+                "reservation": {
+                    "id": args.reservation,
+                    "arrival": args.arrival,
+                    "departure": args.departure,
+                    "place": {"name": args.place},
+                    "accommodation": {"name": args.accommodation},
+                },
+            },
+        }
+    if args.command == "plate-deleted":
+        data = {"license_plate": args.plate}
+        if args.reservation:
+            data["reservation_id"] = args.reservation
+        return {"event": "license_plate.deleted", "data": data}
+    return {"event": "reservation.deleted", "data": {"id": args.reservation}}
+
+
+async def main(args: argparse.Namespace) -> None:
+    payload = _build(args)
+    async with ClientSession() as session:
+        async with session.post(args.url, json=payload) as response:
+            print(response.status, await response.text())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    updated = commands.add_parser("plate-updated")
+    updated.add_argument("--plate", required=True)
+    updated.add_argument("--reservation", required=True)
+    updated.add_argument("--arrival")
+    updated.add_argument("--departure")
+    updated.add_argument("--place")
+    updated.add_argument("--accommodation")
+
+    deleted = commands.add_parser("plate-deleted")
+    deleted.add_argument("--plate", required=True)
+    deleted.add_argument("--reservation")
+
+    reservation_deleted = commands.add_parser("reservation-deleted")
+    reservation_deleted.add_argument("--reservation", required=True)
+
+    raw = commands.add_parser("raw")
+    raw.add_argument("file", help="JSON file with one change, a list, or {\"events\": [...]}")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,9 @@
+"""Make the integration's Home Assistant-free modules importable in tests.
+
+The modules are loaded through ``scripts/_loader.py``, which registers the
+package without running its ``__init__`` (that one needs Home Assistant).
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,54 @@
+"""Tests for the CampingCare API client against a local test server."""
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from _loader import load
+
+api = load("api")
+
+
+async def _with_server(handler, test):
+    """Run ``test(client)`` against a server answering every GET with ``handler``."""
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with api.CampingCareAPI(str(server.make_url("")).rstrip("/"), "test") as client:
+            return await test(client)
+    finally:
+        await server.close()
+
+
+def test_plate_lookups_send_the_cached_plate():
+    sent = []
+
+    async def handler(request):
+        sent.append(request.query.get("license_plate") or request.query.get("plate"))
+        return web.json_response([], status=404)
+
+    async def test(client):
+        first = await client.query_license_plate("ab-1 2")
+        second = await client.query_license_plate("AB12")
+        await client.check_license_plate(" ab-12 ")
+        return first, second
+
+    first, second = asyncio.run(_with_server(handler, test))
+
+    assert first == second == {"success": False, "error": api.ERROR_NO_RESERVATION}
+    # The 404 cached under AB12 came from asking for AB12, and is reused for it
+    assert sent == ["AB12", "AB12"]
+
+
+def test_truncated_plate_lookup_is_an_unexpected_format():
+    async def handler(request):
+        return web.Response(text='[{"license_plate": "AB12", "reservation": {"id": 1}}, {"lic', content_type="application/json")
+
+    async def test(client):
+        return await client.query_license_plate("AB12"), await client.query_license_plate("AB12", full=True)
+
+    summary, full = asyncio.run(_with_server(handler, test))
+
+    assert summary == full == {"success": False, "error": "Unexpected response format"}
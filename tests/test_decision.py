@@ -0,0 +1,78 @@
+"""Tests for gate decisions from the local index and from API summaries."""
+from datetime import date
+
+from _loader import load
+
+decision = load("decision")
+index_module = load("index")
+models = load("models")
+
+TODAY = date(2026, 7, 15)
+
+
+def _item(plate: str, reservation_id: int = 1, arrival: str = "2026-07-10", departure: str = "2026-07-20") -> dict:
+    return {
+        "license_plate": plate,
+        "reservation": {"id": reservation_id, "arrival": arrival, "departure": departure, "place": {"name": "A1"}},
+    }
+
+
+def _summary(plate: str) -> "models.ReservationSummary":
+    return models.ReservationSummary.from_item(_item(plate))
+
+
+def test_index_allows_the_booked_plate_up_to_separators_and_confusables():
+    index = index_module.ReservationIndex.from_items([_item("AB-123-CD")], TODAY)
+
+    exact = decision.decide_local(index, "ab 123 cd", TODAY)
+    folded = decision.decide_local(index, "A8123CD", TODAY)
+
+    assert exact.allowed and exact.match == "exact" and exact.reservation_id == "1"
+    assert folded.allowed and folded.match == "fuzzy" and folded.matched_plate == "AB123CD"
+
+
+def test_index_denies_a_plate_one_edit_away():
+    index = index_module.ReservationIndex.from_items([_item("AB123CD")], TODAY)
+
+    result = decision.decide_local(index, "AB123CE", TODAY)
+
+    assert not result.allowed
+    assert result.reason == decision.REASON_UNCERTAIN_MATCH
+    assert result.reservation_id is None
+    assert [candidate.plate for candidate in result.candidates] == ["AB123CD"]
+
+
+def test_api_summaries_of_another_plate_do_not_open_the_gate():
+    result = decision.decide_summaries("AB123CE", [_summary("AB123CD")], TODAY)
+
+    assert not result.allowed
+    assert result.reason == decision.REASON_UNCERTAIN_MATCH
+    assert result.reservation_id is None
+
+
+def test_api_summaries_only_decide_on_the_read_plate():
+    summaries = [_summary("AB123CD"), models.ReservationSummary.from_item(_item("AB123CE", 2))]
+
+    result = decision.decide_summaries("AB-123-CE", summaries, TODAY)
+
+    assert result.allowed
+    assert result.match == "exact"
+    assert result.matched_plate == "AB123CE"
+    assert result.reservation_id == "2"
+
+
+def test_api_without_summaries_is_an_unknown_plate():
+    result = decision.decide_summaries("AB123CE", [], TODAY)
+
+    assert not result.allowed
+    assert result.reason == decision.REASON_UNKNOWN_PLATE
+
+
+def test_departed_reservation_is_denied():
+    index = index_module.ReservationIndex()
+    index.add_item(_item("AB123CD", departure="2026-07-14"))
+
+    result = decision.decide_local(index, "AB123CD", TODAY)
+
+    assert not result.allowed
+    assert result.reason == decision.REASON_DEPARTED
@@ -0,0 +1,47 @@
+"""Tests for plate normalization and fuzzy matching of camera reads."""
+from _loader import load
+
+matching = load("matching")
+
+
+def _matcher(*plates: str) -> "matching.PlateMatcher":
+    matcher = matching.PlateMatcher()
+    for plate in plates:
+        matcher.add(plate)
+    return matcher
+
+
+def test_separators_and_case_are_an_exact_match():
+    [candidate] = _matcher("AB-123-CD").match("ab 123 cd")
+
+    assert candidate.plate == "AB123CD"
+    assert candidate.exact and candidate.certain
+
+
+def test_confusable_characters_are_certain_but_not_exact():
+    [candidate] = _matcher("AB123CD").match("A8I23CD")
+
+    assert candidate.certain and not candidate.exact
+
+
+def test_one_edit_away_is_a_candidate_but_not_certain():
+    [candidate] = _matcher("AB123CD").match("AB123CE")
+
+    assert candidate.plate == "AB123CD"
+    assert candidate.distance == 1
+    assert not candidate.certain
+
+
+def test_certain_match_ranks_first():
+    candidates = _matcher("AB123CD", "AB123CE").match("AB123CE")
+
+    assert [candidate.plate for candidate in candidates] == ["AB123CE", "AB123CD"]
+    assert candidates[0].certain and not candidates[1].certain
+
+
+def test_removed_plate_no_longer_matches():
+    matcher = _matcher("AB123CD")
+    matcher.remove("ab-123-cd")
+
+    assert matcher.match("AB123CD") == []
+    assert len(matcher) == 0
@@ -0,0 +1,40 @@
+"""Tests for the streaming JSON array parser."""
+import asyncio
+
+import pytest
+
+from _loader import load
+
+models = load("models")
+
+
+async def _chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _parse(body: str, size: int):
+    return asyncio.run(models.async_parse_array(_chunks(body.encode(), size), lambda value: value))
+
+
+@pytest.mark.parametrize("size", [1, 3])
+def test_number_split_across_chunks(size):
+    assert _parse("[1.5e3]", size) == [1500.0]
+
+
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_elements_split_across_chunks(size):
+    body = '[{"license_plate": "AB-12"}, 12, "x,]", [1, [2]], -0.25e-1 , true]'
+    assert _parse(body, size) == [{"license_plate": "AB-12"}, 12, "x,]", [1, [2]], -0.025, True]
+
+
+@pytest.mark.parametrize("body", ["[1 2]", "[1,]", "[,1]", "[1", '[{"a": 1}', "[1.5e"])
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_malformed_or_truncated_body_raises(body, size):
+    with pytest.raises(ValueError):
+        _parse(body, size)
+
+
+def test_non_array_body_is_returned_as_parsed():
+    assert _parse('{"error": "x"}', 2) == {"error": "x"}
+    assert _parse("", 2) is None
@@ -0,0 +1,85 @@
+"""Tests for the request pipeline's circuit breaker and rate limiter."""
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from _loader import load
+
+api = load("api")
+resilience = load("resilience")
+
+
+class FakeClock:
+    """A monotonic clock the test moves by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _with_server(handler, test):
+    """Run ``test(client)`` against a server answering every GET with ``handler``."""
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with api.CampingCareAPI(str(server.make_url("")).rstrip("/"), "test") as client:
+            return await test(client)
+    finally:
+        await server.close()
+
+
+def _open_breaker(clock: FakeClock) -> "resilience.CircuitBreaker":
+    breaker = resilience.CircuitBreaker(1, 30, clock)
+    breaker.record_failure()
+    clock.now += 31
+    assert breaker.state == "half_open"
+    return breaker
+
+
+def test_rate_limited_probe_releases_half_open_breaker():
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+
+    async def handler(request):
+        return web.Response(status=429, headers={"Retry-After": "0"})
+
+    async def test(client):
+        client._breaker = breaker
+        return await client.check_license_plate("AB12CD")
+
+    result = asyncio.run(_with_server(handler, test))
+
+    assert not result["success"]
+    assert breaker.state == "half_open"
+    # The next call may probe again instead of being rejected as circuit open
+    assert breaker.check() is True
+
+
+def test_long_retry_after_fails_fast():
+    async def handler(request):
+        return web.Response(status=429, headers={"Retry-After": "3600"})
+
+    async def test(client):
+        await client.check_license_plate("AB12CD")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await client.check_license_plate("XY98ZZ")
+        return result, loop.time() - started
+
+    result, elapsed = asyncio.run(_with_server(handler, test))
+
+    assert not result["success"]
+    assert "rate limited" in result["error"]
+    assert elapsed < 1
+
+
+def test_retry_after_is_capped():
+    assert resilience.retry_after("3600", 60) == 60
+    assert resilience.retry_after("2.5", 60) == 2.5
+    assert resilience.retry_after("-1", 60) == 0.0
+    assert resilience.retry_after("Wed, 21 Oct 2015 07:28:00 GMT", 60) is None